@@ -5,7 +5,7 @@ This module provides the foundational components that all other modules depend o
 """
 
 from .permission_manager import PermissionManager, PermissionLevel
-from .logger import AuditLogger, AuditEntry
+from .logger import AuditLogger, AsyncAuditLogger, AuditEntry
 from .ollama_client import OllamaClient
 from .file_indexer import FileIndexer
 from .os_operator import OS_Operator
@@ -14,6 +14,7 @@ __all__ = [
     "PermissionManager",
     "PermissionLevel", 
     "AuditLogger",
+    "AsyncAuditLogger",
     "AuditEntry",
     "OllamaClient",
     "FileIndexer",
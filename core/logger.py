@@ -5,14 +5,189 @@ Provides append-only logging of all actions with timestamps, permission levels,
 and execution results for security auditing and debugging.
 """
 
+import atexit
+import csv
+import io
 import json
+import mmap
 import os
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import queue
+import shutil
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, TextIO, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    _loads = json.loads
+
+
+# Block size used when reading the log backwards from the end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _reverse_lines(path: Path) -> Iterator[bytes]:
+    """
+    Yield the lines of a file from last to first.
+    
+    The file is read backwards in fixed-size blocks as the caller consumes
+    lines, so stopping early never reads more than the blocks it needed.
+    
+    Args:
+        path: Path to the file
+        
+    Yields:
+        Lines without line terminators, most recent first
+    """
+    with open(path, "rb") as f:
+        pos = os.fstat(f.fileno()).st_size
+        remainder = b""
+        
+        while pos > 0:
+            read_size = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            
+            # The first line may continue in the previous block
+            remainder = lines[0]
+            for i in range(len(lines) - 1, 0, -1):
+                yield lines[i]
+        
+        yield remainder
+
+
+def _scan_lines(path: Path, needle: bytes) -> Iterator[bytes]:
+    """
+    Yield the lines of a file that contain a byte string.
+    
+    The file is memory-mapped and the needle is searched within each line's
+    range before the line is copied out, so non-matching lines are never
+    materialized or parsed.
+    
+    Args:
+        path: Path to the file
+        needle: Bytes that a line must contain to be yielded
+        
+    Yields:
+        Matching lines, without line terminators
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                if mm.find(needle, pos, end) != -1:
+                    yield mm[pos:end]
+                pos = end + 1
+
+
+# Leading bytes of a log line, as written by compact encoders and by the
+# default json.dumps separators of older versions
+_TIMESTAMP_PREFIXES = (b'{"timestamp":"', b'{"timestamp": "')
+
+
+def _scan_timestamp_lines(path: Path, prefix: bytes) -> Iterator[bytes]:
+    """
+    Yield the lines of a file whose timestamp starts with a byte string.
+    
+    Entries always serialize the timestamp first, so for lines that begin
+    with a known timestamp key only the bytes right after it are compared.
+    Lines in any other layout fall back to a substring search.
+    
+    Args:
+        path: Path to the file
+        prefix: Leading bytes of the timestamp, e.g. b"2024-01-31"
+        
+    Yields:
+        Matching lines, without line terminators
+    """
+    compact, spaced = _TIMESTAMP_PREFIXES
+    
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                
+                head = mm[pos:pos + len(spaced)]
+                if head.startswith(compact):
+                    start = pos + len(compact)
+                    match = mm[start:start + len(prefix)] == prefix
+                elif head == spaced:
+                    start = pos + len(spaced)
+                    match = mm[start:start + len(prefix)] == prefix
+                else:
+                    match = mm.find(prefix, pos, end) != -1
+                
+                if match:
+                    yield mm[pos:end]
+                pos = end + 1
+
+
+# (second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last timestamp
+_timestamp_cache = (0, "")
+
+
+def _fast_timestamp() -> str:
+    """
+    Return the current local time in ISO 8601 format with microseconds.
+    
+    The date/time prefix is formatted once per second and reused, so most
+    calls only format the microsecond suffix.
+    """
+    global _timestamp_cache
+    
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    
+    return f"{prefix}.{micros:06d}"
+
 
 class ActionType(Enum):
     """Types of actions that can be logged."""
@@ -35,7 +210,13 @@ class ActionStatus(Enum):
     DRY_RUN = "dry_run"
 
 
-@dataclass
+# Enum .value goes through a descriptor on every access; these plain dict
+# lookups are cheaper on the logging hot path
+_AT_VAL = {action_type: action_type.value for action_type in ActionType}
+_AS_VAL = {status: status.value for status in ActionStatus}
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """Represents a single audit log entry."""
     timestamp: str
@@ -60,44 +241,368 @@ class AuditEntry:
     ) -> "AuditEntry":
         """Factory method to create an audit entry with current timestamp."""
         return cls(
-            timestamp=datetime.now().isoformat(),
-            action_type=action_type.value,
+            timestamp=_fast_timestamp(),
+            action_type=_AT_VAL[action_type],
             action_description=action_description,
             permission_level=permission_level,
             user_approved=user_approved,
-            status=status.value,
+            status=_AS_VAL[status],
             result=result,
             metadata=metadata or {}
         )
     
     def to_json(self) -> str:
         """Convert entry to JSON string."""
-        return json.dumps(asdict(self), ensure_ascii=False)
+        return self.to_bytes().decode("utf-8")
+    
+    def to_bytes(self) -> bytes:
+        """Convert entry to UTF-8 encoded JSON bytes."""
+        return _dumps({
+            "timestamp": self.timestamp,
+            "action_type": self.action_type,
+            "action_description": self.action_description,
+            "permission_level": self.permission_level,
+            "user_approved": self.user_approved,
+            "status": self.status,
+            "result": self.result,
+            "metadata": self.metadata,
+        })
     
     @classmethod
-    def from_json(cls, json_str: str) -> "AuditEntry":
+    def from_json(cls, json_str: Union[str, bytes]) -> "AuditEntry":
         """Create entry from JSON string."""
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls(**data)
 
 
+# Sidecar index layout: an 8-byte header followed by one fixed-width record
+# per log line of (line offset, line length, action type id, status id,
+# timestamp in ns). The last header byte is the layout version; an index
+# with a different version is rebuilt from the log.
+_INDEX_MAGIC = b"FRIDX\x00\x00\x02"
+_INDEX_RECORD = struct.Struct("<QIBBxxq")
+_INDEX_READ_RECORDS = 4096
+_UNKNOWN_ID = 0xFF
+_ACTION_TYPE_IDS = {action_type.value: i for i, action_type in enumerate(ActionType)}
+_STATUS_IDS = {status.value: i for i, status in enumerate(ActionStatus)}
+
+
+# Index timestamp of entries whose timestamp isn't ISO 8601
+_UNKNOWN_TS = -1
+
+
+def _timestamp_ns(timestamp: str) -> int:
+    """
+    Convert an ISO 8601 local timestamp to nanoseconds since the epoch.
+    
+    Timestamps from _fast_timestamp() in the current second are converted
+    from the epoch second they were formatted from, without parsing.
+    
+    Returns:
+        Nanoseconds since the epoch, or _UNKNOWN_TS if the timestamp is not
+        ISO 8601
+    """
+    seconds, prefix = _timestamp_cache
+    try:
+        if (prefix and len(timestamp) == len(prefix) + 7 and timestamp.startswith(prefix)
+                and timestamp[len(prefix)] == "."):
+            return (seconds * 1_000_000 + int(timestamp[len(prefix) + 1:])) * 1000
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000) * 1000
+    except (ValueError, TypeError, AttributeError):
+        return _UNKNOWN_TS
+
+
+class _AuditIndex:
+    """
+    Fixed-width binary index over the lines of an audit log.
+    
+    Records are appended in log order. While their timestamps are
+    non-decreasing (sorted is True) date ranges can be located with a binary
+    search; clock adjustments or caller-supplied timestamps can break that
+    order, after which callers must filter every record. Lines written by
+    other processes or before the index existed are picked up by catch_up().
+    
+    Every logger of the same log shares the index, so changes to the log and
+    index are made under locked(), an exclusive lock on the index file. On
+    platforms without fcntl, append() still drops records for lines that
+    are already indexed.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = open(self.path, "a+b")
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self.count = 0
+        self.end_offset = 0
+        self._last_ts = 0
+        
+        # Whether the first _checked records have non-decreasing, known
+        # timestamps, the greatest of which is _checked_ts
+        self.sorted = True
+        self._checked = 0
+        self._checked_ts = 0
+        
+        with self.locked():
+            self._fh.seek(0)
+            if self._fh.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                self.reset()
+            else:
+                self._refresh()
+    
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the index file lock, excluding other writers of the log. Reentrant."""
+        with self._thread_lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and fcntl is not None:
+                    fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+    
+    def _refresh(self) -> None:
+        """Reload the record count and last record from disk."""
+        self._fh.flush()
+        size = os.fstat(self._fh.fileno()).st_size
+        body = size - len(_INDEX_MAGIC)
+        if body < 0 or body % _INDEX_RECORD.size:
+            self.reset()
+            return
+        
+        self.count = body // _INDEX_RECORD.size
+        if self.count:
+            self._fh.seek(size - _INDEX_RECORD.size)
+            offset, length, _, _, self._last_ts = _INDEX_RECORD.unpack(
+                self._fh.read(_INDEX_RECORD.size)
+            )
+            self.end_offset = offset + length + 1
+        else:
+            self.end_offset = 0
+            self._last_ts = 0
+        
+        if self.count > self._checked:
+            # Records appended by other writers since the last check
+            new = islice(self.iter_records(self._checked), self.count - self._checked)
+            self._check_order(record[4] for record in new)
+    
+    def _check_order(self, timestamps: Iterable[int]) -> None:
+        """Update sorted with the timestamps of the records after the checked ones."""
+        for timestamp_ns in timestamps:
+            self._checked += 1
+            if not self.sorted:
+                continue
+            if timestamp_ns == _UNKNOWN_TS or timestamp_ns < self._checked_ts:
+                self.sorted = False
+            else:
+                self._checked_ts = timestamp_ns
+    
+    def reset(self) -> None:
+        """Discard all records."""
+        self._fh.truncate(0)
+        self._fh.write(_INDEX_MAGIC)
+        self._fh.flush()
+        self.count = 0
+        self.end_offset = 0
+        self._last_ts = 0
+        self.sorted = True
+        self._checked = 0
+        self._checked_ts = 0
+    
+    def append(self, records: List[Tuple[int, int, int, int, int]]) -> None:
+        """
+        Append (offset, length, action type id, status id, timestamp ns) records.
+        
+        Records for lines before end_offset, which are already indexed, are
+        dropped. Call under locked() after catch_up().
+        """
+        if records and records[0][0] < self.end_offset:
+            records = [record for record in records if record[0] >= self.end_offset]
+        if not records:
+            return
+        
+        self._fh.write(b"".join(_INDEX_RECORD.pack(*record) for record in records))
+        self._fh.flush()
+        if self._checked == self.count:
+            self._check_order(record[4] for record in records)
+        offset, length, _, _, self._last_ts = records[-1]
+        self.end_offset = offset + length + 1
+        self.count += len(records)
+    
+    def catch_up(self, log_path: Path, upto: Optional[int] = None) -> None:
+        """
+        Index complete log lines between the last indexed line and upto.
+        
+        Args:
+            log_path: Path to the JSONL log file
+            upto: Byte offset to index up to (defaults to the end of the log)
+        """
+        with self.locked():
+            self._catch_up(log_path, upto)
+    
+    def _catch_up(self, log_path: Path, upto: Optional[int]) -> None:
+        """Index complete log lines up to upto. Caller holds locked()."""
+        self._refresh()
+        if upto is None:
+            upto = log_path.stat().st_size
+        if upto < self.end_offset:
+            # The log was truncated or replaced underneath the index
+            self.reset()
+        if upto == self.end_offset:
+            return
+        
+        records = []
+        last_ts = self._last_ts
+        with open(log_path, "rb") as f:
+            f.seek(self.end_offset)
+            offset = self.end_offset
+            while offset < upto:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # Partially written line
+                
+                type_id = status_id = _UNKNOWN_ID
+                timestamp_ns = last_ts
+                try:
+                    data = _loads(line)
+                    timestamp_ns = _timestamp_ns(data["timestamp"])
+                    type_id = _ACTION_TYPE_IDS.get(data["action_type"], _UNKNOWN_ID)
+                    status_id = _STATUS_IDS.get(data["status"], _UNKNOWN_ID)
+                except (ValueError, KeyError, TypeError):
+                    pass
+                if timestamp_ns != _UNKNOWN_TS:
+                    last_ts = timestamp_ns
+                
+                records.append((offset, len(line) - 1, type_id, status_id, timestamp_ns))
+                offset += len(line)
+        
+        self.append(records)
+    
+    def iter_records(self, start: int = 0) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield records in log order, starting from record number start."""
+        with open(self.path, "rb") as f:
+            f.seek(len(_INDEX_MAGIC) + start * _INDEX_RECORD.size)
+            while True:
+                chunk = f.read(_INDEX_RECORD.size * _INDEX_READ_RECORDS)
+                usable = len(chunk) - len(chunk) % _INDEX_RECORD.size
+                if not usable:
+                    return
+                yield from _INDEX_RECORD.iter_unpack(chunk[:usable])
+    
+    def bisect_timestamp(self, timestamp_ns: int) -> int:
+        """
+        Return the number of the first record at or after timestamp_ns.
+        
+        Only meaningful while sorted is True.
+        """
+        lo, hi = 0, self.count
+        if not hi:
+            return 0
+        
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    offset = len(_INDEX_MAGIC) + mid * _INDEX_RECORD.size
+                    if _INDEX_RECORD.unpack_from(mm, offset)[4] < timestamp_ns:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+        return lo
+    
+    def close(self) -> None:
+        """Close the index file."""
+        self._fh.close()
+
+
+# Column order of CSV exports
+_CSV_HEADER = (
+    "timestamp", "action_type", "action_description", "permission_level",
+    "user_approved", "status", "result"
+)
+
+
+# Loggers whose log file is open, flushed and closed at interpreter exit.
+# Held weakly so an unreferenced logger and its files can be collected.
+_open_loggers: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    """Flush and close every logger that is still open."""
+    for audit_logger in list(_open_loggers):
+        audit_logger.close()
+
+
 class AuditLogger:
     """
     Append-only audit logger for Friday.
     
     All actions are logged to a JSONL file for security auditing.
     The log is append-only to ensure integrity.
+    
+    Entries are buffered in memory and written in batches through a
+    persistent file handle, at the latest flush_interval seconds after they
+    were logged. Call flush() (or close()) to force pending entries to disk;
+    pending entries are also flushed at interpreter exit.
+    
+    A sidecar index (<log>.idx) records the offset, action type and time of
+    every line so date and action type queries avoid rescanning the log.
     """
     
-    def __init__(self, log_path: str = "data/audit_log.jsonl"):
+    def __init__(
+        self,
+        log_path: str = "data/audit_log.jsonl",
+        flush_threshold: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        durable: bool = False,
+        use_index: bool = True,
+        template_cache_size: int = 256
+    ):
         """
         Initialize the audit logger.
         
         Args:
             log_path: Path to the JSONL log file
+            flush_threshold: Buffered bytes that trigger a write to disk
+            flush_interval: Maximum seconds an entry may sit in the buffer
+            durable: If True, fsync the log file on every flush
+            use_index: If True, maintain a sidecar index for queries
+            template_cache_size: Number of pre-encoded entry templates to keep
         """
         self.log_path = Path(log_path)
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self.durable = durable
         self._ensure_log_directory()
+        
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+        self._fh = open(self.log_path, "ab", buffering=1 << 20)
+        
+        # Guards the buffer and file handle across log(), flush() and clear()
+        self._lock = threading.RLock()
+        
+        # Writes out an idle buffer once flush_interval has passed
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Pre-encoded JSON for repeated (type, description, level, approval,
+        # status) combinations, least recently used first
+        self.template_cache_size = template_cache_size
+        self._template_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        
+        # (line length, action type id, status id, timestamp ns) of each
+        # buffered entry
+        self._pending_index: List[Tuple[int, int, int, int]] = []
+        self._index: Optional[_AuditIndex] = None
+        if use_index:
+            self._index = _AuditIndex(self.log_path.with_name(self.log_path.name + ".idx"))
+            self._index.catch_up(self.log_path)
+        
+        _open_loggers.add(self)
     
     def _ensure_log_directory(self) -> None:
         """Create the log directory if it doesn't exist."""
@@ -111,11 +616,167 @@ class AuditLogger:
         """
         Append an audit entry to the log.
         
+        The entry is buffered and written once the buffer exceeds
+        flush_threshold, or at most flush_interval seconds later.
+        
         Args:
             entry: The AuditEntry to log
+        
+        Raises:
+            ValueError: If the logger has been closed
+        """
+        with self._lock:
+            if self._fh.closed:
+                raise ValueError("I/O operation on closed audit log")
+            data = self._encode(entry)
+            self._append(data, self._index_fields(entry))
+    
+    def _index_fields(self, entry: AuditEntry) -> Optional[Tuple[int, int, int]]:
+        """Return the (action type id, status id, timestamp ns) to index an entry under."""
+        if self._index is None:
+            return None
+        return (
+            _ACTION_TYPE_IDS.get(entry.action_type, _UNKNOWN_ID),
+            _STATUS_IDS.get(entry.status, _UNKNOWN_ID),
+            _timestamp_ns(entry.timestamp)
+        )
+    
+    def _append(self, data: bytes, fields: Optional[Tuple[int, int, int]]) -> None:
+        """
+        Add an encoded entry to the buffer and write it out when due. Caller holds the lock.
+        
+        Args:
+            data: The entry's JSON line, without the newline
+            fields: The entry's index fields from _index_fields()
+        """
+        self._buffer += data
+        self._buffer += b"\n"
+        if fields is not None:
+            self._pending_index.append((len(data),) + fields)
+        
+        if (len(self._buffer) >= self.flush_threshold
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self._write_buffer()
+        else:
+            self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Write the buffer flush_interval from now unless already scheduled. Caller holds the lock."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _timed_flush(self) -> None:
+        """Timer callback that writes out the buffer."""
+        with self._lock:
+            self._flush_timer = None
+            self._write_buffer()
+    
+    def _encode(self, entry: AuditEntry) -> bytes:
+        """
+        Encode an entry as a JSON line, reusing cached templates.
+        
+        Audit entries repeat the same descriptive fields far more often than
+        their timestamp, result and metadata. With the stdlib encoder, those
+        fields are encoded once per distinct combination and spliced in, which
+        yields the same bytes as AuditEntry.to_bytes(). orjson is faster
+        encoding the whole entry in one call, so no template is used with it.
         """
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(entry.to_json() + "\n")
+        if orjson is not None or self.template_cache_size <= 0:
+            return entry.to_bytes()
+        
+        key = (
+            entry.action_type,
+            entry.action_description,
+            entry.permission_level,
+            entry.user_approved,
+            entry.status
+        )
+        template = self._template_cache.get(key)
+        if template is None:
+            template = _dumps({
+                "action_type": entry.action_type,
+                "action_description": entry.action_description,
+                "permission_level": entry.permission_level,
+                "user_approved": entry.user_approved,
+                "status": entry.status
+            })[1:-1]
+            self._template_cache[key] = template
+            if len(self._template_cache) > self.template_cache_size:
+                self._template_cache.popitem(last=False)
+        else:
+            self._template_cache.move_to_end(key)
+        
+        tail = _dumps({"result": entry.result, "metadata": entry.metadata})
+        return b"".join((b'{"timestamp":', _dumps(entry.timestamp), b",", template, b",", tail[1:]))
+    
+    def flush(self) -> None:
+        """Write all buffered entries to the log file."""
+        with self._lock:
+            self._write_buffer()
+    
+    def _write_buffer(self) -> None:
+        """
+        Write the buffer to the log file. Caller holds the lock.
+        
+        Unlike flush(), this is never overridden, so it is safe to call
+        while subclasses are moving entries into the buffer.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        if self._fh.closed:
+            return
+        
+        # Other loggers of the same log must not write between the offsets
+        # computed here and the index records that use them
+        with self._index_lock():
+            records = []
+            if self._buffer:
+                start = self._fh.seek(0, os.SEEK_END)
+                if self._index is not None:
+                    # Index anything other writers appended before this batch
+                    self._index.catch_up(self.log_path, start)
+                    for length, type_id, status_id, timestamp_ns in self._pending_index:
+                        records.append((start, length, type_id, status_id, timestamp_ns))
+                        start += length + 1
+                
+                self._fh.write(self._buffer)
+                self._buffer.clear()
+                self._pending_index.clear()
+            self._fh.flush()
+            
+            if self.durable:
+                os.fsync(self._fh.fileno())
+            
+            # Only index lines once they are in the file, so readers never see
+            # an index record pointing past the end of the log
+            if records:
+                self._index.append(records)
+        
+        self._last_flush = time.monotonic()
+    
+    def _index_lock(self):
+        """Return a context manager holding the index file lock, if there is an index."""
+        if self._index is None:
+            return nullcontext()
+        return self._index.locked()
+    
+    def close(self) -> None:
+        """Flush pending entries and close the log file."""
+        with self._lock:
+            if self._fh.closed:
+                return
+            
+            try:
+                self.flush()
+            finally:
+                self._fh.close()
+                if self._index is not None:
+                    self._index.close()
+                _open_loggers.discard(self)
     
     def log_action(
         self,
@@ -144,34 +805,99 @@ class AuditLogger:
         self.log(entry)
         return entry
     
-    def get_recent(self, limit: int = 100) -> List[AuditEntry]:
+    def _read_indexed(self, records: List[Tuple[int, int, int, int, int]]) -> List[AuditEntry]:
+        """Read and parse the log lines referenced by index records."""
+        entries = []
+        
+        with open(self.log_path, "rb") as f:
+            for offset, length, _, _, _ in records:
+                f.seek(offset)
+                try:
+                    entries.append(AuditEntry.from_json(f.read(length)))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+        
+        return entries
+    
+    def iter_recent_raw(self) -> Iterator[Dict[str, Any]]:
         """
-        Get the most recent audit entries.
+        Iterate over raw audit records from most recent to oldest.
         
-        Args:
-            limit: Maximum number of entries to return
-            
-        Returns:
-            List of AuditEntry objects, most recent first
+        Records are read and parsed lazily, so a caller that stops early
+        only pays for the records it consumed.
+        
+        Yields:
+            Decoded JSON objects, most recent first
         """
-        entries = []
+        self.flush()
         
         if not self.log_path.exists():
-            return entries
+            return
         
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        # Get last 'limit' entries
-        for line in reversed(lines[-limit:]):
+        for line in _reverse_lines(self.log_path):
             line = line.strip()
             if line:
                 try:
-                    entries.append(AuditEntry.from_json(line))
-                except json.JSONDecodeError:
+                    data = _loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
+                if isinstance(data, dict):
+                    yield data
+    
+    def iter_recent(self) -> Iterator[AuditEntry]:
+        """
+        Iterate over audit entries from most recent to oldest.
         
-        return entries
+        Yields:
+            AuditEntry objects, most recent first
+        """
+        for data in self.iter_recent_raw():
+            yield AuditEntry(**data)
+    
+    def get_recent_raw(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get the most recent audit records without building AuditEntry objects.
+        
+        Args:
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of decoded JSON objects, most recent first
+        """
+        return list(islice(self.iter_recent_raw(), max(limit, 0)))
+    
+    def get_recent_rows(self, limit: int = 100) -> List[Tuple[str, str, str, Optional[bool]]]:
+        """
+        Get the most recent audit entries as display rows.
+        
+        Args:
+            limit: Maximum number of rows to return
+            
+        Returns:
+            List of (timestamp, action_description, status, user_approved)
+            tuples, most recent first
+        """
+        return [
+            (
+                data.get("timestamp", ""),
+                data.get("action_description", ""),
+                data.get("status", ""),
+                data.get("user_approved"),
+            )
+            for data in islice(self.iter_recent_raw(), max(limit, 0))
+        ]
+    
+    def get_recent(self, limit: int = 100) -> List[AuditEntry]:
+        """
+        Get the most recent audit entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            List of AuditEntry objects, most recent first
+        """
+        return list(islice(self.iter_recent(), max(limit, 0)))
     
     def get_by_date(self, date: datetime) -> List[AuditEntry]:
         """
@@ -185,20 +911,38 @@ class AuditLogger:
         """
         entries = []
         date_str = date.strftime("%Y-%m-%d")
+        self.flush()
         
         if not self.log_path.exists():
             return entries
         
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and date_str in line:
-                    try:
-                        entry = AuditEntry.from_json(line)
-                        if entry.timestamp.startswith(date_str):
-                            entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+        if self._index is not None:
+            self._index.catch_up(self.log_path)
+        
+        if self._index is not None and self._index.sorted:
+            day_start = datetime(date.year, date.month, date.day)
+            start_ns = int(day_start.timestamp()) * 1_000_000_000
+            end_ns = int((day_start + timedelta(days=1)).timestamp()) * 1_000_000_000
+            
+            first = self._index.bisect_timestamp(start_ns)
+            records = []
+            for record in self._index.iter_records(first):
+                if record[4] >= end_ns:
+                    break
+                records.append(record)
+            
+            for entry in self._read_indexed(records):
+                if entry.timestamp.startswith(date_str):
+                    entries.append(entry)
+            return entries
+        
+        for line in _scan_timestamp_lines(self.log_path, date_str.encode()):
+            try:
+                entry = AuditEntry.from_json(line)
+                if entry.timestamp.startswith(date_str):
+                    entries.append(entry)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
         
         return entries
     
@@ -214,75 +958,124 @@ class AuditLogger:
             List of matching AuditEntry objects
         """
         entries = []
+        self.flush()
         
         if not self.log_path.exists():
             return entries
         
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if len(entries) >= limit:
+        if self._index is not None:
+            type_id = _ACTION_TYPE_IDS[_AT_VAL[action_type]]
+            self._index.catch_up(self.log_path)
+            records = []
+            for record in self._index.iter_records():
+                if len(records) >= limit:
                     break
-                    
-                line = line.strip()
-                if line:
-                    try:
-                        entry = AuditEntry.from_json(line)
-                        if entry.action_type == action_type.value:
-                            entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+                if record[2] == type_id:
+                    records.append(record)
+            return self._read_indexed(records)
+        
+        # Only lines containing the quoted value can match
+        value = _AT_VAL[action_type]
+        needle = f'"{value}"'.encode()
+        for line in _scan_lines(self.log_path, needle):
+            if len(entries) >= limit:
+                break
+            
+            try:
+                entry = AuditEntry.from_json(line)
+                if entry.action_type == value:
+                    entries.append(entry)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
         
         return entries
     
-    def get_denied_actions(self, limit: int = 50) -> List[AuditEntry]:
+    def get_denied_actions(self, limit: int = 50, since: Optional[datetime] = None) -> List[AuditEntry]:
         """
         Get actions that were denied by the user.
         
         Useful for reviewing security decisions.
+        
+        Args:
+            limit: Maximum number of entries to return
+            since: Only include actions logged at or after this time
+            
+        Returns:
+            List of denied AuditEntry objects
         """
         entries = []
+        denied = _AS_VAL[ActionStatus.DENIED]
+        since_ns = int(since.timestamp() * 1_000_000) * 1000 if since is not None else _UNKNOWN_TS
+        self.flush()
         
         if not self.log_path.exists():
             return entries
         
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if len(entries) >= limit:
+        if self._index is not None:
+            status_id = _STATUS_IDS[denied]
+            self._index.catch_up(self.log_path)
+            first = 0
+            if since is not None and self._index.sorted:
+                first = self._index.bisect_timestamp(since_ns)
+            records = []
+            for record in self._index.iter_records(first):
+                if len(records) >= limit:
                     break
-                    
-                line = line.strip()
-                if line:
-                    try:
-                        entry = AuditEntry.from_json(line)
-                        if entry.status == ActionStatus.DENIED.value:
-                            entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+                # Entries with unknown timestamps never match a since filter
+                if record[3] == status_id and (since is None or record[4] >= since_ns):
+                    records.append(record)
+            return self._read_indexed(records)
+        
+        # Only lines containing the quoted value can match
+        needle = f'"{denied}"'.encode()
+        for line in _scan_lines(self.log_path, needle):
+            if len(entries) >= limit:
+                break
+            
+            try:
+                entry = AuditEntry.from_json(line)
+                if entry.status != denied:
+                    continue
+                if since is not None and _timestamp_ns(entry.timestamp) < since_ns:
+                    continue
+                entries.append(entry)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
         
         return entries
     
-    def export(self, format: str = "json") -> str:
+    def export(self, format: str = "json", file: Optional[TextIO] = None) -> str:
         """
         Export the entire audit log.
         
         Args:
             format: Export format ("json" or "csv")
+            file: Optional text file to write the export to instead of
+                  building it in memory
             
         Returns:
-            String containing the exported data
+            String containing the exported data (empty if file was given)
         """
-        entries = self.get_recent(limit=10000)
+        records = self.get_recent_raw(limit=10000)
         
         if format == "json":
-            return json.dumps([asdict(e) for e in entries], indent=2)
+            if orjson is not None:
+                data = orjson.dumps(records, option=orjson.OPT_INDENT_2).decode("utf-8")
+            else:
+                data = json.dumps(records, indent=2)
+            if file is None:
+                return data
+            file.write(data)
+            return ""
         elif format == "csv":
-            if not entries:
-                return "timestamp,action_type,action_description,permission_level,user_approved,status,result\n"
-            
-            lines = ["timestamp,action_type,action_description,permission_level,user_approved,status,result"]
-            for e in entries:
-                lines.append(f'"{e.timestamp}","{e.action_type}","{e.action_description}",{e.permission_level},{e.user_approved},"{e.status}","{e.result or ""}"')
-            return "\n".join(lines)
+            buffer = io.StringIO() if file is None else file
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(_CSV_HEADER)
+            writer.writerows([
+                [record.get(field) for field in _CSV_HEADER]
+                for record in records
+            ])
+            return buffer.getvalue() if file is None else ""
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
@@ -301,11 +1094,145 @@ class AuditLogger:
         if not confirm:
             return False
         
-        # Create backup before clearing
-        if self.log_path.exists():
+        with self._lock:
+            if self._fh.closed or not self.log_path.exists():
+                return False
+            
+            # Back up a durable copy, then empty the file in place so the open
+            # handle keeps writing to the same inode
+            self.flush()
+            os.fsync(self._fh.fileno())
             backup_path = self.log_path.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
-            self.log_path.rename(backup_path)
-            self.log_path.touch()
+            shutil.copy2(self.log_path, backup_path)
+            with self._index_lock():
+                self._fh.seek(0)
+                self._fh.truncate(0)
+                if self._index is not None:
+                    self._index.reset()
             return True
+
+
+class AsyncAuditLogger(AuditLogger):
+    """
+    Audit logger that writes entries on a background thread.
+    
+    log() encodes the entry and puts the bytes on a bounded queue, so callers
+    never wait on disk I/O, and an entry that can't be serialized raises in
+    the caller as it does with AuditLogger. The worker thread moves queued
+    entries into the write buffer, which is written out as in AuditLogger.
+    Reads, flush() and close() first drain the queue, so they always see
+    every entry logged before them.
+    
+    Errors the worker hits while writing are kept and raised by the next
+    flush() or close(), so the worker itself keeps running.
+    """
+    
+    def __init__(self, *args, queue_size: int = 10_000, **kwargs):
+        """
+        Initialize the audit logger.
+        
+        The worker thread is started by the first log() call, so a logger
+        that never logs costs no thread.
+        
+        Args:
+            queue_size: Maximum number of queued entries before log() blocks
+            *args, **kwargs: Passed on to AuditLogger
+        """
+        self._queue: "queue.Queue[Tuple[bytes, Optional[Tuple[int, int, int]]]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self._error: Optional[BaseException] = None
+        self._wake = threading.Event()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+        super().__init__(*args, **kwargs)
+    
+    def log(self, entry: AuditEntry) -> None:
+        """
+        Encode an audit entry and queue it to be written by the worker thread.
         
-        return False
+        Args:
+            entry: The AuditEntry to log
+        
+        Raises:
+            TypeError: If the entry can't be serialized to JSON
+            ValueError: If the logger has been closed
+        """
+        if self._stopping:
+            raise ValueError("I/O operation on closed audit log")
+        item = (entry.to_bytes(), self._index_fields(entry))
+        if self._worker is None:
+            self._start_worker()
+        self._queue.put(item)
+        self._wake.set()
+        
+        if self._stopping:
+            # close() drains the queue once it holds the lock, unless it has
+            # already done so and the entry was queued too late
+            with self._lock:
+                if self._fh.closed:
+                    raise ValueError("I/O operation on closed audit log")
+    
+    def _start_worker(self) -> None:
+        """Start the worker thread unless it is already running or stopped."""
+        with self._lock:
+            if self._worker is None and not self._stopping:
+                self._worker = threading.Thread(target=self._run, name="AuditLogger", daemon=True)
+                self._worker.start()
+    
+    def _drain(self) -> None:
+        """Move all queued entries into the write buffer. Caller holds the lock."""
+        while True:
+            try:
+                data, fields = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self._append(data, fields)
+            except Exception as e:
+                # Entries stay in the buffer if writing it out failed
+                if self._error is None:
+                    self._error = e
+    
+    def _schedule_flush(self) -> None:
+        """The worker thread already writes out idle buffers."""
+    
+    def _run(self) -> None:
+        """Worker loop: drain the queue when woken and flush idle buffers."""
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                # Entries are only taken off the queue while holding the lock,
+                # so a flush() on another thread never misses one in flight
+                self._drain()
+                if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                    try:
+                        self._write_buffer()
+                    except Exception as e:
+                        if self._error is None:
+                            self._error = e
+    
+    def flush(self) -> None:
+        """
+        Write all queued and buffered entries to the log file.
+        
+        Raises:
+            OSError: If this or an earlier write by the worker thread failed
+        """
+        with self._lock:
+            self._drain()
+            error, self._error = self._error, None
+            self._write_buffer()
+            if error is not None:
+                raise error
+    
+    def close(self) -> None:
+        """Stop the worker thread, then flush pending entries and close the log file."""
+        with self._lock:
+            worker = self._worker
+            self._stopping = True
+        if worker is not None:
+            self._wake.set()
+            worker.join()
+        super().close()
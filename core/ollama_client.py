@@ -5,14 +5,17 @@ Provides a simple interface to communicate with the local Ollama instance.
 All LLM interactions go through this client.
 """
 
+import http.client
 import json
-import subprocess
+import re
+import time
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any, Generator
+from typing import List, Dict, Optional, Any, Generator, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a chat message."""
     role: str  # "system", "user", or "assistant"
@@ -41,19 +44,146 @@ class ChatResponse:
         return None
 
 
+# Markers of a reasoning block. `ollama run` prints "Thinking..." /
+# "...done thinking." while the HTTP API wraps reasoning in <think> tags.
+_THINK_START_MARKERS = ("thinking...", "okay, so", "<think>")
+_THINK_END_MARKERS = ("done thinking", "</think>")
+_THINK_MARKERS = _THINK_START_MARKERS + _THINK_END_MARKERS
+
+
+def _marker_pattern(markers: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a pattern matching any of markers literally."""
+    return re.compile("|".join(map(re.escape, markers)))
+
+
+# One pattern per marker group, so locating the next marker is a single
+# pass over the text however many of the markers never occur
+_THINK_START_RE = _marker_pattern(_THINK_START_MARKERS)
+_THINK_END_RE = _marker_pattern(_THINK_END_MARKERS)
+_THINK_RE = _marker_pattern(_THINK_MARKERS)
+
+
+def _strip_reasoning(text: str) -> str:
+    """
+    Remove reasoning blocks and blank lines from a complete response.
+    
+    Produces the same output as feeding the whole text through
+    _ReasoningFilter, but markers are located with one regex search over the
+    whole text and only the lines holding them are inspected individually.
+    """
+    lowered = text.lower()
+    size = len(text)
+    if len(lowered) != size:
+        # Lowercasing changed offsets; fall back to filtering line by line
+        reasoning_filter = _ReasoningFilter()
+        return (reasoning_filter.feed(text) + reasoning_filter.finish()).strip()
+    
+    kept = []
+    pos = 0
+    
+    while pos < size:
+        match = _THINK_RE.search(lowered, pos)
+        if match is None:
+            kept.append(text[pos:])
+            break
+        
+        marker = match.start()
+        line_start = text.rfind("\n", pos, marker) + 1
+        line_end = text.find("\n", marker)
+        if line_end == -1:
+            line_end = size
+        kept.append(text[pos:line_start])
+        
+        # Start markers take priority over end markers on the same line
+        if _THINK_START_RE.search(lowered, line_start, line_end):
+            # Skip through the next line with an end marker and no start marker
+            search_from = line_end
+            line_end = size
+            while True:
+                match = _THINK_END_RE.search(lowered, search_from)
+                if match is None:
+                    break
+                marker = match.start()
+                end_line_start = text.rfind("\n", 0, marker) + 1
+                end_line_end = text.find("\n", marker)
+                if end_line_end == -1:
+                    end_line_end = size
+                if not _THINK_START_RE.search(lowered, end_line_start, end_line_end):
+                    line_end = end_line_end
+                    break
+                search_from = end_line_end
+        
+        pos = line_end
+    
+    return "\n".join(line for line in "".join(kept).split("\n") if line.strip()).strip()
+
+
+class _ReasoningFilter:
+    """
+    Incrementally strip the reasoning/thinking process from model output.
+    
+    Text can be fed in arbitrary chunks as it streams in; complete lines are
+    filtered as soon as they arrive and a trailing partial line is held back
+    until more text (or finish()) completes it.
+    """
+    
+    def __init__(self):
+        self._partial = ""
+        self._skip_thinking = False
+    
+    def feed(self, text: str) -> str:
+        """Filter a chunk of text, returning the output that is ready."""
+        self._partial += text
+        *lines, self._partial = self._partial.split("\n")
+        return self._filter_lines(lines)
+    
+    def finish(self) -> str:
+        """Filter any remaining partial line at the end of the stream."""
+        lines = [self._partial]
+        self._partial = ""
+        return self._filter_lines(lines)
+    
+    def _filter_lines(self, lines: List[str]) -> str:
+        filtered = []
+        
+        for line in lines:
+            line_lower = line.lower().strip()
+            
+            # Skip lines that indicate thinking process
+            if 'thinking...' in line_lower or 'okay, so' in line_lower or '<think>' in line_lower:
+                self._skip_thinking = True
+                continue
+            
+            if 'done thinking' in line_lower or '</think>' in line_lower:
+                self._skip_thinking = False
+                continue
+            
+            # Skip empty lines during thinking
+            if self._skip_thinking:
+                continue
+            
+            # Keep non-thinking lines
+            if line.strip():
+                filtered.append(line + "\n")
+        
+        return "".join(filtered)
+
+
 class OllamaClient:
     """
     Client for interacting with local Ollama instance.
     
-    This client uses the Ollama CLI/API to communicate with locally running models.
-    It supports both synchronous and streaming responses.
+    This client uses the Ollama HTTP API to communicate with locally running models,
+    reusing a single persistent connection across requests. It supports both
+    synchronous and streaming responses. Instances are not thread-safe.
     """
     
     def __init__(
         self,
         model: str = "deepseek-r1:1.5b",
         host: str = "http://localhost:11434",
-        timeout: int = 120
+        timeout: int = 120,
+        keep_alive: str = "30m"
     ):
         """
         Initialize the Ollama client.
@@ -62,11 +192,98 @@ class OllamaClient:
             model: Name of the model to use
             host: Ollama API host URL
             timeout: Request timeout in seconds
+            keep_alive: How long Ollama keeps the model loaded after a request
         """
         self.model = model
         self.host = host
         self.timeout = timeout
+        self.keep_alive = keep_alive
         self._conversation_history: List[Message] = []
+        self._connection: Optional[http.client.HTTPConnection] = None
+        
+        # (fetch time, model names) from the last successful list_models()
+        self._models_cache: Optional[Tuple[float, List[str]]] = None
+        self._models_ttl = 30.0
+    
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return the persistent connection to the Ollama API, opening it if needed."""
+        if self._connection is None:
+            url = urlsplit(self.host)
+            connection_class = (
+                http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+            )
+            self._connection = connection_class(url.hostname, url.port, timeout=self.timeout)
+        return self._connection
+    
+    def close(self) -> None:
+        """Close the connection to the Ollama API."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> http.client.HTTPResponse:
+        """
+        Send a request to the Ollama API over the persistent connection.
+        
+        The caller must read the response to the end (or call close()) before
+        issuing another request.
+        
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/api/tags"
+            payload: Optional JSON request body
+            timeout: Socket timeout in seconds (defaults to self.timeout)
+            
+        Returns:
+            The HTTP response
+            
+        Raises:
+            OSError: If Ollama cannot be reached
+            http.client.HTTPException: If the connection fails mid-request
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        timeout = timeout if timeout is not None else self.timeout
+        
+        # A kept-alive connection may have been closed by the server; retry once
+        for attempt in range(2):
+            connection = self._get_connection()
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                return connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+    
+    def _request_json(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request and decode its JSON response.
+        
+        Raises:
+            RuntimeError: If Ollama returns an error response
+        """
+        response = self._request(method, path, payload, timeout)
+        data = json.loads(response.read() or b"{}")
+        if response.status != 200:
+            raise RuntimeError(data.get("error") or f"HTTP {response.status}")
+        return data
     
     def is_available(self) -> bool:
         """
@@ -76,47 +293,54 @@ class OllamaClient:
             True if Ollama is accessible, False otherwise
         """
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            self._request_json("GET", "/api/version", timeout=5)
+            return True
+        except (OSError, http.client.HTTPException, RuntimeError, ValueError):
+            self.close()
             return False
     
     def list_models(self) -> List[str]:
         """
         List available models.
         
+        Results are cached for a short time so repeated model checks don't
+        each hit the API.
+        
         Returns:
             List of model names
         """
+        if self._models_cache is not None:
+            fetched_at, models = self._models_cache
+            if time.monotonic() - fetched_at < self._models_ttl:
+                return list(models)
+        
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=10
-            )
-            if result.returncode != 0:
-                return []
-            
-            models = []
-            lines = result.stdout.strip().split("\n")
-            for line in lines[1:]:  # Skip header
-                if line.strip():
-                    parts = line.split()
-                    if parts:
-                        models.append(parts[0])
-            return models
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            data = self._request_json("GET", "/api/tags", timeout=10)
+        except (OSError, http.client.HTTPException, RuntimeError, ValueError):
+            self.close()
             return []
+        
+        models = [model["name"] for model in data.get("models", [])]
+        self._models_cache = (time.monotonic(), models)
+        return list(models)
+    
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory ahead of the first request.
+        
+        Returns:
+            True if the model was loaded, False otherwise
+        """
+        try:
+            self._request_json(
+                "POST",
+                "/api/generate",
+                {"model": self.model, "keep_alive": self.keep_alive}
+            )
+            return True
+        except (OSError, http.client.HTTPException, RuntimeError, ValueError):
+            self.close()
+            return False
     
     def model_exists(self, model_name: Optional[str] = None) -> bool:
         """
@@ -150,35 +374,7 @@ class OllamaClient:
         Returns:
             Filtered text with only the final answer
         """
-        # DeepSeek R1 typically wraps reasoning in specific patterns
-        # Common patterns: "Thinking...", "...done thinking.", or between <think> tags
-        
-        # Remove "Thinking..." prefix and "...done thinking." suffix
-        lines = text.split('\n')
-        filtered_lines = []
-        skip_thinking = False
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Skip lines that indicate thinking process
-            if 'thinking...' in line_lower or 'okay, so' in line_lower:
-                skip_thinking = True
-                continue
-            
-            if '...done thinking.' in line_lower or 'done thinking' in line_lower:
-                skip_thinking = False
-                continue
-            
-            # Skip empty lines during thinking
-            if skip_thinking:
-                continue
-            
-            # Keep non-thinking lines
-            if line.strip():
-                filtered_lines.append(line)
-        
-        result = '\n'.join(filtered_lines).strip()
+        result = _strip_reasoning(text)
         
         # If filtering removed everything, return original
         if not result:
@@ -186,6 +382,85 @@ class OllamaClient:
         
         return result
     
+    def _stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Stream a chat request and yield each JSON object of the reply.
+        
+        Raises:
+            OSError: If Ollama cannot be reached or the request times out
+            RuntimeError: If Ollama returns an error
+        """
+        if system_prompt:
+            messages = [{"role": "system", "content": system_prompt}] + list(messages)
+        
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "options": {"temperature": temperature, "num_predict": max_tokens},
+            "keep_alive": self.keep_alive,
+        }
+        
+        completed = False
+        try:
+            response = self._request("POST", "/api/chat", payload)
+            if response.status != 200:
+                data = json.loads(response.read() or b"{}")
+                completed = True
+                raise RuntimeError(data.get("error") or f"HTTP {response.status}")
+            
+            # One JSON object per line
+            for line in response:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                yield data
+            completed = True
+        finally:
+            # An unfinished response leaves the connection unusable
+            if not completed:
+                self.close()
+    
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> Generator[str, None, None]:
+        """
+        Send a chat request to Ollama and yield the reply as it is generated.
+        
+        Reasoning/thinking output is filtered out as the text streams in.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            system_prompt: Optional system prompt to prepend
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            
+        Yields:
+            Chunks of the model's reply
+        """
+        reasoning_filter = _ReasoningFilter()
+        
+        for data in self._stream_chat(messages, system_prompt, temperature, max_tokens):
+            text = reasoning_filter.feed(data.get("message", {}).get("content", ""))
+            if text:
+                yield text
+        
+        text = reasoning_filter.finish()
+        if text:
+            yield text
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -205,70 +480,55 @@ class OllamaClient:
         Returns:
             ChatResponse with the model's reply
         """
-        # Build the prompt
-        prompt_parts = []
-        
-        if system_prompt:
-            prompt_parts.append(f"System: {system_prompt}\n")
-        
-        for msg in messages:
-            role = msg.get("role", "user").capitalize()
-            content = msg.get("content", "")
-            prompt_parts.append(f"{role}: {content}")
-        
-        prompt = "\n".join(prompt_parts)
-        prompt += "\nAssistant:"
+        reasoning_filter = _ReasoningFilter()
+        raw_parts = []
+        filtered_parts = []
+        final: Dict[str, Any] = {}
         
         try:
-            # Use ollama run command with UTF-8 encoding
-            result = subprocess.run(
-                [
-                    "ollama", "run", self.model,
-                    prompt
-                ],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',  # Replace invalid characters instead of crashing
-                timeout=self.timeout
-            )
-            
-            if result.returncode != 0:
-                return ChatResponse(
-                    content=f"Error: {result.stderr or 'Unknown error'}",
-                    model=self.model,
-                    done=True
-                )
-            
-            # Check if stdout is None
-            if result.stdout is None:
-                return ChatResponse(
-                    content="Error: No response from model",
-                    model=self.model,
-                    done=True
-                )
-            
-            # Filter out reasoning/thinking process
-            filtered_content = self._filter_reasoning(result.stdout.strip())
+            for data in self._stream_chat(messages, system_prompt, temperature, max_tokens):
+                chunk = data.get("message", {}).get("content", "")
+                raw_parts.append(chunk)
+                filtered_parts.append(reasoning_filter.feed(chunk))
+                if data.get("done"):
+                    final = data
+            filtered_parts.append(reasoning_filter.finish())
             
+        except RuntimeError as e:
             return ChatResponse(
-                content=filtered_content,
+                content=f"Error: {e}",
                 model=self.model,
                 done=True
             )
-            
-        except subprocess.TimeoutExpired:
+        except ValueError:
+            return ChatResponse(
+                content="Error: Invalid response from Ollama",
+                model=self.model,
+                done=True
+            )
+        except TimeoutError:
             return ChatResponse(
                 content="Error: Request timed out",
                 model=self.model,
                 done=True
             )
-        except FileNotFoundError:
+        except (OSError, http.client.HTTPException):
             return ChatResponse(
-                content="Error: Ollama not found. Please install Ollama.",
+                content="Error: Could not connect to Ollama. Run 'ollama serve' to start it.",
                 model=self.model,
                 done=True
             )
+        
+        # If filtering removed everything, return original
+        filtered_content = "".join(filtered_parts).strip() or "".join(raw_parts).strip()
+        
+        return ChatResponse(
+            content=filtered_content,
+            model=self.model,
+            done=True,
+            total_duration=final.get("total_duration"),
+            eval_count=final.get("eval_count")
+        )
     
     def generate(
         self,
@@ -289,12 +549,38 @@ class OllamaClient:
         Returns:
             The model's response text
         """
-        messages = [{"role": "user", "content": prompt}]
-        response = self.chat(messages, system_prompt=system_prompt, temperature=temperature)
-        return response.content
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {"temperature": temperature},
+            "keep_alive": self.keep_alive,
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        
+        try:
+            data = self._request_json("POST", "/api/generate", payload)
+        except RuntimeError as e:
+            return f"Error: {e}"
+        except ValueError:
+            self.close()
+            return "Error: Invalid response from Ollama"
+        except TimeoutError:
+            self.close()
+            return "Error: Request timed out"
+        except (OSError, http.client.HTTPException):
+            self.close()
+            return "Error: Could not connect to Ollama. Run 'ollama serve' to start it."
+        
+        return self._filter_reasoning(data.get("response", "").strip())
     
     def clear_history(self) -> None:
-        """Clear the conversation history."""
+        """
+        Clear the conversation history.
+        
+        This does not unload the model; Ollama keeps it loaded for keep_alive.
+        """
         self._conversation_history.clear()
     
     def add_to_history(self, role: str, content: str) -> None:
@@ -328,24 +614,18 @@ class OllamaClient:
             Dictionary with model information
         """
         try:
-            result = subprocess.run(
-                ["ollama", "show", self.model],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                return {"name": self.model, "error": result.stderr}
-            
-            return {
-                "name": self.model,
-                "info": result.stdout.strip()
-            }
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            data = self._request_json("POST", "/api/show", {"model": self.model}, timeout=10)
+        except RuntimeError as e:
+            return {"name": self.model, "error": str(e)}
+        except (OSError, http.client.HTTPException, ValueError):
+            self.close()
             return {"name": self.model, "error": "Could not get model info"}
+        
+        return {
+            "name": self.model,
+            "details": data.get("details", {}),
+            "parameters": data.get("parameters", "")
+        }
     
     def pull_model(self, model: str) -> bool:
         """
@@ -360,14 +640,21 @@ class OllamaClient:
             True if successful, False otherwise
         """
         try:
-            result = subprocess.run(
-                ["ollama", "pull", model],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
+            data = self._request_json(
+                "POST",
+                "/api/pull",
+                {"model": model, "stream": False},
                 timeout=600  # 10 minutes for large models
             )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        except RuntimeError:
             return False
+        except (OSError, http.client.HTTPException, ValueError):
+            self.close()
+            return False
+        
+        if data.get("status") != "success":
+            return False
+        
+        # The new model won't be in a cached model list
+        self._models_cache = None
+        return True
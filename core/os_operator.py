@@ -1,24 +1,173 @@
+import asyncio
+import datetime
 import subprocess
 import os
 import pathlib
 import shutil
+import stat
 import platform
 import sys
 import glob
 import send2trash 
+from typing import Any, Dict, List, Optional
 
 from .logger import ActionType, ActionStatus, AuditLogger
 from .permission_manager import PermissionManager, PermissionLevel, ActionResult, ActionRequest
 from .file_indexer import FileIndexer
 
 
+def _scan_files(dir_path: str, recursive: bool) -> List[str]:
+    """
+    List the paths of the files in a directory.
+    
+    Uses os.scandir, whose entries usually know their type without a stat
+    call. Symlinks to files are included; symlinked directories are not
+    descended into.
+    
+    Args:
+        dir_path: Directory to list
+        recursive: If True, include files in subdirectories
+        
+    Returns:
+        List of file paths
+    """
+    if not recursive:
+        with os.scandir(dir_path) as entries:
+            return [entry.path for entry in entries if entry.is_file()]
+    
+    files = []
+    pending = [dir_path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return files
+
+
+# Bytes requested per os.copy_file_range call
+_COPY_CHUNK_SIZE = 1 << 30
+
+
+def _copy_file(source: str, destination: str) -> None:
+    """
+    Copy a file and its metadata like shutil.copy2.
+    
+    Where os.copy_file_range is available (Linux) the data is copied in
+    the kernel, which also lets filesystems such as btrfs or XFS share
+    extents instead of copying. Falls back to shutil.copy2 if the
+    filesystems don't support it.
+    
+    Args:
+        source: Path of the file to copy
+        destination: Path of the copy, or a directory to copy into
+    """
+    if not hasattr(os, "copy_file_range") or not os.path.isfile(source):
+        shutil.copy2(source, destination)
+        return
+    
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    
+    # Opening the destination truncates it, so refuse to copy onto the source
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            # Copy until end of file rather than trusting st_size
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK_SIZE)
+            while copied and os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK_SIZE):
+                pass
+    except OSError:
+        # e.g. EXDEV or EOPNOTSUPP on older kernels and some filesystems
+        shutil.copy2(source, destination)
+        return
+    
+    if not copied:
+        # procfs, sysfs, some FUSE filesystems and cross-filesystem copies on
+        # some kernels report 0 bytes on the first call even when the file has
+        # data, so let copy2 read it (for an empty file this is just a recopy)
+        shutil.copy2(source, destination)
+        return
+    
+    shutil.copystat(source, destination)
+
 
 class OS_Operator:
+    # Required permission level and description template per action type
+    _ACTION_TEMPLATES = {
+        "read_file": (PermissionLevel.READ, "Read file content from: {target}"),
+        "list_files": (PermissionLevel.READ, "List files in directory: {target}"),
+        "move_file": (PermissionLevel.SAFE_WRITE, "Move {target} to {destination}"),
+        "copy_file": (PermissionLevel.SAFE_WRITE, "Copy {target} to {destination}"),
+        "write_file": (PermissionLevel.SAFE_WRITE, "Write {size} bytes to {name}"),
+        "create_directory": (PermissionLevel.SAFE_WRITE, "Create a directory at {target}"),
+        "append_to_file": (PermissionLevel.SAFE_WRITE, "Adds content to the end of a file."),
+        "delete_item": (PermissionLevel.SAFE_DELETE, "Delete item at {target}"),
+        "get_file_metadata": (PermissionLevel.READ, "Get metadata for {target}"),
+        "search_files": (PermissionLevel.READ, "Search for files matching '{target}'"),
+    }
+
     def __init__(self, permission_manager: PermissionManager, logger: AuditLogger, file_indexer: FileIndexer = None,):
         self.logger = logger
         self.permission_manager = permission_manager
         self.file_indexer = file_indexer
 
+    def flush(self) -> None:
+        """
+        Write out any audit entries the logger is still holding.
+        
+        Pass an AsyncAuditLogger to take audit writes off the calling thread;
+        its entries are batched by a background worker until flushed.
+        """
+        self.logger.flush()
+
+    def __enter__(self) -> "OS_Operator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    def _emit(
+        self,
+        action_type: ActionType,
+        status: ActionStatus,
+        description: str,
+        level: PermissionLevel,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Log the outcome of an operation to the audit trail."""
+        self.logger.log_action(
+            action_type=action_type,
+            description=description,
+            permission_level=level.value,
+            status=status,
+            metadata=metadata
+        )
+
+    def _check_permission(self, action_type: str, target: str, **fields) -> ActionResult:
+        """
+        Check permission for one of the operations in _ACTION_TEMPLATES.
+        
+        Args:
+            action_type: Key into _ACTION_TEMPLATES
+            target: The path or query the action operates on
+            **fields: Extra values for the description template
+            
+        Returns:
+            ActionResult from the PermissionManager
+        """
+        level, template = self._ACTION_TEMPLATES[action_type]
+        return self.permission_manager.check_action_type(
+            action_type,
+            level,
+            target=target,
+            description=template.format(target=target, **fields)
+        )
+
     def _execute_command(self, permission_level, command, dry_run=False):
         """
         Execute a command with permission checking.
@@ -56,12 +205,12 @@ class OS_Operator:
                 )
                 
                 # Log the action
-                self.logger.log_action(
-                    action_type=ActionType.EXECUTE,
-                    description=f"Execute command: {command}",
-                    permission_level=permission_level.value,
-                    status=ActionStatus.SUCCESS,
-                    metadata={"output": output.stdout}
+                self._emit(
+                    ActionType.EXECUTE,
+                    ActionStatus.SUCCESS,
+                    f"Execute command: {command}",
+                    permission_level,
+                    {"output": output.stdout}
                 )
                 
                 return ActionResult(
@@ -72,12 +221,12 @@ class OS_Operator:
                 )
             except Exception as e:
                 # Log the error
-                self.logger.log_action(
-                    action_type=ActionType.EXECUTE,
-                    description=f"Execute command: {command}",
-                    permission_level=permission_level.value,
-                    status=ActionStatus.FAILED,
-                    metadata={"error": str(e)}
+                self._emit(
+                    ActionType.EXECUTE,
+                    ActionStatus.FAILED,
+                    f"Execute command: {command}",
+                    permission_level,
+                    {"error": str(e)}
                 )
                 
                 return ActionResult(
@@ -113,27 +262,20 @@ class OS_Operator:
         # Resolve path to prevent path traversal attacks
         path = pathlib.Path(file_path).resolve()
         
-        action = ActionRequest(
-            action_type="read_file",
-            description=f"Read file content from: {path}",
-            target=str(path),
-            required_level=PermissionLevel.READ
-        )
-        
         # Security Gate
-        permission_check = self.permission_manager.check_permission(action)
+        permission_check = self._check_permission("read_file", str(path))
         if not permission_check.success:
             return permission_check
             
         try:
             content = path.read_text(encoding="utf-8")
             
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Read file: {path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"file_size": path.stat().st_size}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.SUCCESS,
+                f"Read file: {path}",
+                PermissionLevel.READ,
+                {"file_size": path.stat().st_size}
             )
             
             return ActionResult(
@@ -144,12 +286,12 @@ class OS_Operator:
             )
             
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Failed to read file: {path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.FAILED,
+                f"Failed to read file: {path}",
+                PermissionLevel.READ,
+                {"error": str(e)}
             )
             
             return ActionResult(
@@ -158,6 +300,33 @@ class OS_Operator:
                 message=f"Error reading file {path}: {str(e)}"
             )
     
+    async def aread_file(self, file_path: str) -> ActionResult:
+        """Read a file like read_file() without blocking the event loop.
+
+        The permission check, read and audit logging run in a worker thread.
+
+        Args:
+            file_path: The path to the file to be read. Can be relative or absolute.
+
+        Returns:
+            ActionResult: The result of read_file().
+        """
+        return await asyncio.to_thread(self.read_file, file_path)
+
+    async def aread_files(self, file_paths: List[str]) -> List[ActionResult]:
+        """Read several files concurrently.
+
+        Each file is read with aread_file(), so the reads overlap in the
+        default thread pool.
+
+        Args:
+            file_paths: The paths of the files to be read.
+
+        Returns:
+            List[ActionResult]: One result per path, in the same order.
+        """
+        return list(await asyncio.gather(*(self.aread_file(path) for path in file_paths)))
+
     def list_files(self, dir_path: str, recursive:bool=False) -> ActionResult:
         """List files in a directory after verifying permissions.
 
@@ -175,20 +344,13 @@ class OS_Operator:
 
         path = pathlib.Path(dir_path).resolve()
         
-        action = ActionRequest(
-            action_type="list_files",
-            description=f"List files in directory: {path}",
-            target=str(path),
-            required_level=PermissionLevel.READ
-        )
-
         if not path.exists():
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Failed to list files: directory does not exist: {path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": "Directory does not exist"}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.FAILED,
+                f"Failed to list files: directory does not exist: {path}",
+                PermissionLevel.READ,
+                {"error": "Directory does not exist"}
             )
             return ActionResult(
                 success=False,
@@ -196,22 +358,19 @@ class OS_Operator:
                 message=f"Directory does not exist: {path}"
             )
 
-        permission_check = self.permission_manager.check_permission(action)
+        permission_check = self._check_permission("list_files", str(path))
         if not permission_check.success:
             return permission_check
         
         try:
-            if recursive:
-                files = [str(file) for file in path.rglob('*') if file.is_file()]
-            else:
-                files = [str(file) for file in path.iterdir() if file.is_file()]
+            files = _scan_files(str(path), recursive)
                 
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"List files in directory: {path} (recursive={recursive})",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"file_count": len(files)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.SUCCESS,
+                f"List files in directory: {path} (recursive={recursive})",
+                PermissionLevel.READ,
+                {"file_count": len(files)}
             )
             
             return ActionResult(
@@ -221,12 +380,12 @@ class OS_Operator:
                 data=files
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Failed to list files in directory: {path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.FAILED,
+                f"Failed to list files in directory: {path}",
+                PermissionLevel.READ,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -250,28 +409,20 @@ class OS_Operator:
         source_path = pathlib.Path(source).resolve()
         destination_path = pathlib.Path(destination).resolve()
 
-        # 2. Permission Request Preparation
-        action = ActionRequest(
-            action_type="move_file",
-            description=f"Move {source_path} to {destination_path}",
-            target=str(source_path),
-            required_level=PermissionLevel.SAFE_WRITE
-        )
-        
-        # 3. Security Gate / Permission Check
-        permission_check = self.permission_manager.check_permission(action)
+        # 2. Security Gate / Permission Check
+        permission_check = self._check_permission("move_file", str(source_path), destination=destination_path)
         if not permission_check.success:
             return permission_check
         
-        # 4. Execution Block
+        # 3. Execution Block
         try:
             if not source_path.exists():
-                self.logger.log_action(
-                    action_type=ActionType.WRITE,
-                    description="File not found",
-                    permission_level=PermissionLevel.SAFE_WRITE.value,
-                    status=ActionStatus.FAILED,
-                    metadata={"source": str(source_path), "destination": str(destination_path)}
+                self._emit(
+                    ActionType.WRITE,
+                    ActionStatus.FAILED,
+                    "File not found",
+                    PermissionLevel.SAFE_WRITE,
+                    {"source": str(source_path), "destination": str(destination_path)}
                 )
                 return ActionResult(
                     success=False,
@@ -284,12 +435,12 @@ class OS_Operator:
                 
             shutil.move(str(source_path), str(destination_path))
             
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Successfully moved {source_path} to {destination_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"source": str(source_path), "destination": str(destination_path)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.SUCCESS,
+                f"Successfully moved {source_path} to {destination_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"source": str(source_path), "destination": str(destination_path)}
             )
             return ActionResult(
                 success=True,
@@ -298,12 +449,12 @@ class OS_Operator:
                 data=str(destination_path)
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Error moving file {source_path} to {destination_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.FAILED,
+                f"Error moving file {source_path} to {destination_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -327,28 +478,20 @@ class OS_Operator:
         source_path = pathlib.Path(source).resolve()
         destination_path = pathlib.Path(destination).resolve()
 
-        # 2. Permission Request Preparation
-        action = ActionRequest(
-            action_type="copy_file",
-            description=f"Copy {source_path} to {destination_path}",
-            target=str(source_path),
-            required_level=PermissionLevel.SAFE_WRITE
-        )
-
-        # 3. Security Gate / Permission Check
-        permission_check = self.permission_manager.check_permission(action)
+        # 2. Security Gate / Permission Check
+        permission_check = self._check_permission("copy_file", str(source_path), destination=destination_path)
         if not permission_check.success:
             return permission_check
 
-        # 4. Execution Block
+        # 3. Execution Block
         try:
             if not source_path.exists():
-                self.logger.log_action(
-                    action_type=ActionType.WRITE,
-                    description="File not found",
-                    permission_level=PermissionLevel.SAFE_WRITE.value,
-                    status=ActionStatus.FAILED,
-                    metadata={"source": str(source_path), "destination": str(destination_path)}
+                self._emit(
+                    ActionType.WRITE,
+                    ActionStatus.FAILED,
+                    "File not found",
+                    PermissionLevel.SAFE_WRITE,
+                    {"source": str(source_path), "destination": str(destination_path)}
                 )
                 return ActionResult(
                     success=False,
@@ -359,14 +502,14 @@ class OS_Operator:
             if not destination_path.exists():
                 destination_path.parent.mkdir(parents=True, exist_ok=True)
                 
-            shutil.copy2(str(source_path), str(destination_path))
+            _copy_file(str(source_path), str(destination_path))
             
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Successfully copied {source_path} to {destination_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"source": str(source_path), "destination": str(destination_path)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.SUCCESS,
+                f"Successfully copied {source_path} to {destination_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"source": str(source_path), "destination": str(destination_path)}
             )
 
             return ActionResult(
@@ -376,12 +519,12 @@ class OS_Operator:
                 data=str(destination_path)
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Error copying file {source_path} to {destination_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.FAILED,
+                f"Error copying file {source_path} to {destination_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -402,14 +545,7 @@ class OS_Operator:
         """
         target_path = pathlib.Path(path).resolve()
         
-        action = ActionRequest(
-            action_type="write_file",
-            description=f"Write {len(content)} bytes to {target_path.name}",
-            target=str(target_path),
-            required_level=PermissionLevel.SAFE_WRITE
-        )
-
-        permission_check = self.permission_manager.check_permission(action)
+        permission_check = self._check_permission("write_file", str(target_path), size=len(content), name=target_path.name)
         if not permission_check.success:
             return permission_check
         
@@ -420,12 +556,12 @@ class OS_Operator:
             # Actually write the file
             target_path.write_text(content, encoding="utf-8")
             
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Successfully wrote to {target_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"target": str(target_path), "bytes_written": len(content)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.SUCCESS,
+                f"Successfully wrote to {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"target": str(target_path), "bytes_written": len(content)}
             )
             return ActionResult(
                 success=True,
@@ -434,12 +570,12 @@ class OS_Operator:
                 data=str(target_path)
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Error writing to {target_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.FAILED,
+                f"Error writing to {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -459,13 +595,7 @@ class OS_Operator:
         """
         target_path = pathlib.Path(path).resolve()
 
-        action = ActionRequest(
-            action_type="create_directory",
-            description=f"Create a directory at {target_path}",
-            target=str(target_path),
-            required_level=PermissionLevel.SAFE_WRITE
-        )
-        permission_check = self.permission_manager.check_permission(action)
+        permission_check = self._check_permission("create_directory", str(target_path))
         if not permission_check.success:
             return permission_check
         
@@ -473,12 +603,12 @@ class OS_Operator:
             target_path.parent.mkdir(parents=True, exist_ok=True)
             target_path.mkdir()
 
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Created directory {target_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"target": str(target_path)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.SUCCESS,
+                f"Created directory {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"target": str(target_path)}
             )
             return ActionResult(
                 success=True,
@@ -487,12 +617,12 @@ class OS_Operator:
                 data=str(target_path)
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Error creating directory {target_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.FAILED,
+                f"Error creating directory {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -514,13 +644,7 @@ class OS_Operator:
 
         target_path =pathlib.Path(path).resolve()
 
-        action=ActionRequest(
-            action_type="append_to_file",
-            description=f"Adds content to the end of a file.",
-            target=str(target_path),
-            required_level=PermissionLevel.SAFE_WRITE
-        )
-        permission_check=self.permission_manager.check_permission(action)
+        permission_check=self._check_permission("append_to_file", str(target_path))
         if not permission_check.success:
             return permission_check
 
@@ -530,12 +654,12 @@ class OS_Operator:
             with target_path.open("a", encoding="utf-8") as f:
                 f.write("\n" + content)
             
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Appended {len(content)} bytes to {target_path}",
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"target": str(target_path), "bytes_appended": len(content)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.SUCCESS,
+                f"Appended {len(content)} bytes to {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"target": str(target_path), "bytes_appended": len(content)}
             )
             return ActionResult(
                 success=True,
@@ -545,12 +669,12 @@ class OS_Operator:
             )
 
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.WRITE,
-                description=f"Error appending to {target_path}",
-                status=ActionStatus.FAILED,
-                permission_level=PermissionLevel.SAFE_WRITE.value,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.WRITE,
+                ActionStatus.FAILED,
+                f"Error appending to {target_path}",
+                PermissionLevel.SAFE_WRITE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -571,24 +695,20 @@ class OS_Operator:
         """
         target_path = pathlib.Path(path).resolve()
         
-        action = ActionRequest(
-            action_type="delete_item",
-            description=f"Delete item at {target_path}",
-            target=str(target_path),
-            required_level=PermissionLevel.SAFE_DELETE
-        )
-        permission_check=self.permission_manager.check_permission(action)
+        permission_check=self._check_permission("delete_item", str(target_path))
         if not permission_check.success:
             return permission_check
         
         try:
-            if not target_path.exists():
-                self.logger.log_action(
-                    action_type=ActionType.DELETE,
-                    description="Attempted to delete non-existent item.",
-                    permission_level=PermissionLevel.SAFE_DELETE.value,
-                    status=ActionStatus.FAILED,
-                    metadata={"target": str(target_path)}
+            try:
+                is_dir = stat.S_ISDIR(target_path.stat().st_mode)
+            except (FileNotFoundError, NotADirectoryError):
+                self._emit(
+                    ActionType.DELETE,
+                    ActionStatus.FAILED,
+                    "Attempted to delete non-existent item.",
+                    PermissionLevel.SAFE_DELETE,
+                    {"target": str(target_path)}
                 )
                 return ActionResult(
                     success=False,
@@ -598,16 +718,16 @@ class OS_Operator:
 
             if dry_run:
                 impacted_files = []
-                if target_path.is_dir():
+                if is_dir:
                     impacted_files = [str(p) for p in target_path.rglob('*')]
                 impacted_files.append(str(target_path))
                 
-                self.logger.log_action(
-                    action_type=ActionType.DELETE,
-                    description=f"Dry run: Would delete {target_path}",
-                    permission_level=PermissionLevel.SAFE_DELETE.value,
-                    status=ActionStatus.SUCCESS,
-                    metadata={"target": str(target_path)}
+                self._emit(
+                    ActionType.DELETE,
+                    ActionStatus.SUCCESS,
+                    f"Dry run: Would delete {target_path}",
+                    PermissionLevel.SAFE_DELETE,
+                    {"target": str(target_path)}
                 )
                 
                 return ActionResult(
@@ -620,12 +740,12 @@ class OS_Operator:
             #uses send2trash library to route the file to OS's recycle bin for both files and directories
             send2trash.send2trash(str(target_path))
 
-            self.logger.log_action(
-                action_type=ActionType.DELETE,
-                description=f"Successfully deleted {target_path}",
-                permission_level=PermissionLevel.SAFE_DELETE.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"target": str(target_path)}
+            self._emit(
+                ActionType.DELETE,
+                ActionStatus.SUCCESS,
+                f"Successfully deleted {target_path}",
+                PermissionLevel.SAFE_DELETE,
+                {"target": str(target_path)}
             )
             return ActionResult(
                 success=True,
@@ -634,12 +754,12 @@ class OS_Operator:
                 data=str(target_path)
             )
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.DELETE,
-                description=f"Error deleting {target_path}",
-                permission_level=PermissionLevel.SAFE_DELETE.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.DELETE,
+                ActionStatus.FAILED,
+                f"Error deleting {target_path}",
+                PermissionLevel.SAFE_DELETE,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -657,33 +777,25 @@ class OS_Operator:
         Returns:
             ActionResult: A result object containing metadata (size, created, modified, etc.) in the data field.
         """
-        import datetime
-        
         # 1. Path Resolution
         target_path = pathlib.Path(path).resolve()
         
-        # 2. Permission Request Preparation
-        action = ActionRequest(
-            action_type="get_file_metadata",
-            description=f"Get metadata for {target_path}",
-            target=str(target_path),
-            required_level=PermissionLevel.READ
-        )
-        
-        # 3. Security Gate
-        permission_check = self.permission_manager.check_permission(action)
+        # 2. Security Gate
+        permission_check = self._check_permission("get_file_metadata", str(target_path))
         if not permission_check.success:
             return permission_check
             
-        # 4. Execution Block
+        # 3. Execution Block
         try:
-            if not target_path.exists():
-                self.logger.log_action(
-                    action_type=ActionType.READ,
-                    description="Attempted to get metadata for non-existent item.",
-                    permission_level=PermissionLevel.READ.value,
-                    status=ActionStatus.FAILED,
-                    metadata={"target": str(target_path)}
+            try:
+                stat_info = target_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                self._emit(
+                    ActionType.READ,
+                    ActionStatus.FAILED,
+                    "Attempted to get metadata for non-existent item.",
+                    PermissionLevel.READ,
+                    {"target": str(target_path)}
                 )
                 return ActionResult(
                     success=False,
@@ -691,22 +803,21 @@ class OS_Operator:
                     message=f"File not found: {target_path}"
                 )
 
-            stat_info = target_path.stat()
             file_metadata = {
                 "name": target_path.name,
-                "is_dir": target_path.is_dir(),
-                "is_file": target_path.is_file(),
+                "is_dir": stat.S_ISDIR(stat_info.st_mode),
+                "is_file": stat.S_ISREG(stat_info.st_mode),
                 "size_bytes": stat_info.st_size,
                 "created_at": datetime.datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
                 "modified_at": datetime.datetime.fromtimestamp(stat_info.st_mtime).isoformat()
             }
             
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Retrieved metadata for {target_path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"target": str(target_path)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.SUCCESS,
+                f"Retrieved metadata for {target_path}",
+                PermissionLevel.READ,
+                {"target": str(target_path)}
             )
             
             return ActionResult(
@@ -717,12 +828,12 @@ class OS_Operator:
             )
             
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Error getting metadata for {target_path}",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.FAILED,
+                f"Error getting metadata for {target_path}",
+                PermissionLevel.READ,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -756,26 +867,19 @@ class OS_Operator:
                 message="Search query cannot be empty."
             )
 
-        action = ActionRequest(
-            action_type="search_files",
-            description=f"Search for files matching '{query}'",
-            target=query,
-            required_level=PermissionLevel.READ
-        )
-
-        permission_check = self.permission_manager.check_permission(action)
+        permission_check = self._check_permission("search_files", query)
         if not permission_check.success:
             return permission_check
             
         try:
             results = self.file_indexer.search_files(query, max_results)
             
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Searched for files matching '{query}'",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.SUCCESS,
-                metadata={"query": query, "results_count": len(results)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.SUCCESS,
+                f"Searched for files matching '{query}'",
+                PermissionLevel.READ,
+                {"query": query, "results_count": len(results)}
             )
             
             return ActionResult(
@@ -786,12 +890,12 @@ class OS_Operator:
             )
             
         except Exception as e:
-            self.logger.log_action(
-                action_type=ActionType.READ,
-                description=f"Error searching for files matching '{query}'",
-                permission_level=PermissionLevel.READ.value,
-                status=ActionStatus.FAILED,
-                metadata={"error": str(e)}
+            self._emit(
+                ActionType.READ,
+                ActionStatus.FAILED,
+                f"Error searching for files matching '{query}'",
+                PermissionLevel.READ,
+                {"error": str(e)}
             )
             return ActionResult(
                 success=False,
@@ -6,14 +6,21 @@ Every destructive action MUST go through this module for approval.
 """
 
 import fnmatch
+import functools
+import os
+import pickle
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, Iterable, Tuple, Union
 from pathlib import Path
-import yaml
 
-from .logger import AuditLogger, AuditEntry, ActionType, ActionStatus
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+from .logger import AuditLogger, AsyncAuditLogger, AuditEntry, ActionType, ActionStatus
 
 
 class PermissionLevel(Enum):
@@ -32,7 +39,118 @@ class PermissionLevel(Enum):
     DANGEROUS_DELETE = 7 # High-risk deletions (system files/directories)
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, Any, Any]:
+    """
+    Import PyYAML on first use.
+    
+    With the parsed config cache, most runs never need to parse YAML, so the
+    import is deferred until a config is actually read or written.
+    
+    Returns:
+        Tuple of (yaml module, safe loader class, safe dumper class), using
+        the libyaml-backed classes when available
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+# Blacklist token substring checks are prefiltered by the first
+# _GRAM_SIZE characters of each token once there are this many tokens
+# and no Aho-Corasick automaton
+_GRAM_SIZE = 4
+_GRAM_PREFILTER_MIN_TOKENS = 128
+
+# Literal text before the first glob metacharacter
+_GLOB_PREFIX = re.compile(r"[^*?\[]*")
+
+
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern to a regex with the same semantics as fnmatch.fnmatch."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _compile_globs(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile glob patterns into a single alternation regex.
+    
+    The result matches a name if any of the patterns would, so one regex
+    call replaces a loop over the patterns.
+    
+    Returns:
+        The combined regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+    ))
+
+
+def _bucket_globs(patterns: List[str]) -> Tuple[Dict[str, "re.Pattern[str]"], Optional["re.Pattern[str]"]]:
+    """
+    Group glob patterns by the action-type token they require.
+    
+    A pattern whose literal prefix contains an underscore, such as
+    "delete_*", can only match names whose token before the first underscore
+    is "delete", so it only needs to be tried against those names.
+    
+    Returns:
+        Tuple of (combined regex per token, combined regex of the patterns
+        that can't be bucketed or None)
+    """
+    buckets: Dict[str, List[str]] = {}
+    unbucketed = []
+    for pattern in patterns:
+        prefix = _GLOB_PREFIX.match(os.path.normcase(pattern)).group(0)
+        token, sep, _ = prefix.partition("_")
+        if sep:
+            buckets.setdefault(token, []).append(pattern)
+        else:
+            unbucketed.append(pattern)
+    compiled = {token: _compile_globs(group) for token, group in buckets.items()}
+    return compiled, _compile_globs(unbucketed)
+
+
+def _partition_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], List[str]]:
+    """
+    Split glob patterns into literal names and wildcard patterns.
+    
+    Patterns without glob metacharacters only match themselves, so they can
+    be checked with a set lookup instead of a regex.
+    
+    Returns:
+        Tuple of (normalized literal names, wildcard patterns)
+    """
+    literals = set()
+    globs = []
+    for pattern in patterns:
+        if any(c in pattern for c in "*?["):
+            globs.append(pattern)
+        else:
+            literals.add(os.path.normcase(pattern))
+    return frozenset(literals), globs
+
+
+def _has_any_gram(text: str, grams: FrozenSet[str]) -> bool:
+    """Check if any _GRAM_SIZE-character window of text is in grams."""
+    for i in range(len(text) - _GRAM_SIZE + 1):
+        if text[i:i + _GRAM_SIZE] in grams:
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _default_logger() -> AuditLogger:
+    """Get the audit logger shared by managers created without one."""
+    return AsyncAuditLogger()
+
+
+@dataclass(slots=True, frozen=True)
 class ActionRequest:
     """Represents a request to perform an action."""
     action_type: str
@@ -41,12 +159,19 @@ class ActionRequest:
     parameters: Optional[Dict[str, Any]] = None
     required_level: PermissionLevel = PermissionLevel.READ
     
-    def matches_pattern(self, pattern: str) -> bool:
-        """Check if this action matches a glob pattern."""
-        return fnmatch.fnmatch(self.action_type, pattern)
+    def matches_pattern(self, pattern: Union[str, "re.Pattern[str]"]) -> bool:
+        """
+        Check if this action matches a glob pattern.
+        
+        Args:
+            pattern: Glob pattern, or a regex precompiled with _compile_glob
+        """
+        if isinstance(pattern, str):
+            return fnmatch.fnmatch(self.action_type, pattern)
+        return pattern.match(os.path.normcase(self.action_type)) is not None
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class ActionResult:
     """Result of an action execution."""
     success: bool
@@ -56,6 +181,14 @@ class ActionResult:
     dry_run: bool = False
 
 
+# Shared result for the common read-level approval; ActionResult is frozen
+_READ_APPROVED_RESULT = ActionResult(
+    success=True,
+    status="APPROVED",
+    message="Read operations are always permitted."
+)
+
+
 class PermissionManager:
     """
     Central permission manager for Friday.
@@ -64,6 +197,17 @@ class PermissionManager:
     It maintains whitelists, blacklists, and handles user approval workflows.
     """
     
+    # Preview summary per action type prefix, checked in order
+    _PREVIEW_TEMPLATES = (
+        ("delete", "⚠️  This will DELETE: {target}"),
+        ("write", "📝 This will WRITE to: {target}"),
+        ("execute", "🖥️  This will EXECUTE: {target}"),
+        ("move", "📦 This will MOVE: {target}"),
+    )
+    # Keyed on the token before the first underscore, e.g. "delete_file"
+    _PREVIEW_TEMPLATES_BY_TOKEN = dict(_PREVIEW_TEMPLATES)
+    _DEFAULT_PREVIEW_TEMPLATE = "🔧 This will perform: {description}"
+    
     def __init__(
         self,
         config_path: str = "config.yaml",
@@ -74,18 +218,35 @@ class PermissionManager:
         
         Args:
             config_path: Path to the YAML configuration file
-            logger: AuditLogger instance for logging actions
+            logger: AuditLogger instance for logging actions (defaults to an
+                    AsyncAuditLogger shared by all managers created without
+                    one, so checks don't wait on disk writes)
         """
         self.config_path = Path(config_path)
-        self.logger = logger or AuditLogger()
+        self._config_cache_path = self.config_path.with_suffix(self.config_path.suffix + ".cache")
+        self.logger = logger or _default_logger()
         
         # Load configuration
         self.config = self._load_config()
         
         # Initialize permission lists
         self.whitelist: Dict[str, PermissionLevel] = {}
-        self.blacklist: List[str] = []
-        self.auto_approve: List[str] = []
+        self._blacklist: Tuple[str, ...] = ()
+        self._auto_approve: Tuple[str, ...] = ()
+        
+        # Lookup structures built from the lists by _compile_patterns()
+        self._blacklist_literals: FrozenSet[str] = frozenset()
+        self._blacklist_glob_buckets: Dict[str, "re.Pattern[str]"] = {}
+        self._blacklist_globs: Optional["re.Pattern[str]"] = None
+        self._blacklist_tokens: FrozenSet[str] = frozenset()
+        self._blacklist_automaton: Optional[Any] = None
+        self._blacklist_grams: Optional[FrozenSet[str]] = None
+        self._auto_approve_literals: FrozenSet[str] = frozenset()
+        self._auto_approve_globs: Optional["re.Pattern[str]"] = None
+        
+        # Per-instance cache of _classify_uncached(), cleared whenever the
+        # pattern lists are recompiled
+        self._classify = functools.lru_cache(maxsize=1024)(self._classify_uncached)
         
         self._apply_config()
         
@@ -93,16 +254,40 @@ class PermissionManager:
         self._approval_callback: Optional[Callable[[str, str], bool]] = None
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
+        """
+        Load configuration from YAML file.
+        
+        The parsed config is pickled next to the YAML file and reused for as
+        long as the YAML file's modification time and size are unchanged.
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
             return self._default_config()
         
         try:
+            mtime_ns, size, config = pickle.loads(self._config_cache_path.read_bytes())
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return config
+        except Exception:
+            pass  # Missing, stale or corrupt cache; parse the YAML instead
+        
+        try:
+            yaml, loader, _ = _yaml()
             with open(self.config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
-                return config.get("friday", config)
+                config = yaml.load(f, Loader=loader) or {}
+                config = config.get("friday", config)
         except Exception:
             return self._default_config()
+        
+        try:
+            self._config_cache_path.write_bytes(
+                pickle.dumps((stat.st_mtime_ns, stat.st_size, config), protocol=5)
+            )
+        except OSError:
+            pass
+        
+        return config
     
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration."""
@@ -137,14 +322,77 @@ class PermissionManager:
         perms = self.config.get("permissions", {})
         
         # Auto-approve patterns
-        self.auto_approve = perms.get("auto_approve", [])
+        self._auto_approve = tuple(perms.get("auto_approve", []))
         
         # Blacklist patterns
-        self.blacklist = perms.get("blacklist", [])
+        self._blacklist = tuple(perms.get("blacklist", []))
         
         # Build whitelist from auto_approve
         for pattern in self.auto_approve:
             self.whitelist[pattern] = PermissionLevel.READ
+        
+        self._compile_patterns()
+    
+    @property
+    def blacklist(self) -> Tuple[str, ...]:
+        """
+        Blacklisted patterns.
+        
+        Assign a new sequence, or use add_to_blacklist() and
+        remove_from_blacklist(), to change them; either recompiles the
+        lookup structures used by check_permission().
+        """
+        return self._blacklist
+    
+    @blacklist.setter
+    def blacklist(self, patterns: Iterable[str]) -> None:
+        self._blacklist = tuple(patterns)
+        self._compile_patterns()
+    
+    @property
+    def auto_approve(self) -> Tuple[str, ...]:
+        """
+        Auto-approved action type patterns.
+        
+        Assign a new sequence to change them, which recompiles the lookup
+        structures used by check_permission().
+        """
+        return self._auto_approve
+    
+    @auto_approve.setter
+    def auto_approve(self, patterns: Iterable[str]) -> None:
+        self._auto_approve = tuple(patterns)
+        self._compile_patterns()
+    
+    def _compile_patterns(self) -> None:
+        """
+        Precompile the blacklist and auto-approve glob patterns.
+        
+        Called by the blacklist and auto_approve setters.
+        """
+        self._blacklist_literals, globs = _partition_patterns(self.blacklist)
+        self._blacklist_glob_buckets, self._blacklist_globs = _bucket_globs(globs)
+        
+        self._auto_approve_literals, globs = _partition_patterns(self.auto_approve)
+        self._auto_approve_globs = _compile_globs(globs)
+        
+        # Lowercased blacklist entries for substring checks
+        self._blacklist_tokens = frozenset(pattern.lower() for pattern in self.blacklist)
+        self._blacklist_automaton = None
+        self._blacklist_grams = None
+        if ahocorasick is not None and self._blacklist_tokens and "" not in self._blacklist_tokens:
+            # One pass over the text finds any of the tokens
+            automaton = ahocorasick.Automaton()
+            for token in self._blacklist_tokens:
+                automaton.add_word(token, token)
+            automaton.make_automaton()
+            self._blacklist_automaton = automaton
+        elif (len(self._blacklist_tokens) >= _GRAM_PREFILTER_MIN_TOKENS
+              and all(len(token) >= _GRAM_SIZE for token in self._blacklist_tokens)):
+            # A text containing a token contains that token's first gram
+            self._blacklist_grams = frozenset(token[:_GRAM_SIZE] for token in self._blacklist_tokens)
+        
+        self._classify.cache_clear()
     
     def set_approval_callback(self, callback: Callable[[str, str], bool]) -> None:
         """
@@ -169,6 +417,9 @@ class PermissionManager:
         2. Checks if action is whitelisted/auto-approved
         3. For other actions, requests user approval
         
+        Each decision is logged as a single audit entry; read-only and dry-run
+        approvals are not logged.
+        
         Args:
             action: The ActionRequest to check
             dry_run: If True, only check permissions without executing
@@ -176,24 +427,70 @@ class PermissionManager:
         Returns:
             ActionResult indicating if the action is permitted
         """
-        # Log the permission check
-        self.logger.log_action(
-            action_type=ActionType.PERMISSION,
-            description=f"Permission check: {action.description}",
-            permission_level=action.required_level.value,
-            status=ActionStatus.PENDING,
-            metadata={"action_type": action.action_type, "target": action.target}
+        return self._check(
+            action.action_type,
+            action.description,
+            action.target,
+            action.required_level,
+            dry_run,
+            action
         )
+    
+    def check_action_type(
+        self,
+        action_type: str,
+        required_level: PermissionLevel = PermissionLevel.READ,
+        dry_run: bool = False,
+        target: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> ActionResult:
+        """
+        Check if an action is permitted without building an ActionRequest.
+        
+        Makes the same decision as check_permission() for the equivalent
+        ActionRequest, which is only built if user approval is needed.
+        
+        Args:
+            action_type: Type of action, e.g. "get_time"
+            required_level: Permission level the action requires
+            dry_run: If True, only check permissions without executing
+            target: Target path/command, if any
+            description: Human-readable description (defaults to the action type)
+            
+        Returns:
+            ActionResult indicating if the action is permitted
+        """
+        return self._check(
+            action_type,
+            description if description is not None else action_type,
+            target,
+            required_level,
+            dry_run,
+            None
+        )
+    
+    def _check(
+        self,
+        action_type: str,
+        description: str,
+        target: Optional[str],
+        required_level: PermissionLevel,
+        dry_run: bool,
+        action: Optional[ActionRequest]
+    ) -> ActionResult:
+        """Decide on an action given as primitives; see check_permission()."""
+        classification = self._classify(action_type, target, description)
         
         # Check blacklist first
-        if self._is_blacklisted(action):
+        if classification == "BLACKLISTED":
             self.logger.log_action(
                 action_type=ActionType.PERMISSION,
-                description=f"BLOCKED: {action.description}",
-                permission_level=action.required_level.value,
+                description=f"BLOCKED: {description}",
+                permission_level=required_level.value,
                 user_approved=False,
                 status=ActionStatus.DENIED,
-                result="Blacklisted action"
+                result="Blacklisted action",
+                metadata=self._decision_metadata(action_type, target)
             )
             return ActionResult(
                 success=False,
@@ -203,14 +500,15 @@ class PermissionManager:
             )
         
         # Check if auto-approved
-        if self._is_auto_approved(action):
+        if classification == "AUTO":
             self.logger.log_action(
                 action_type=ActionType.PERMISSION,
-                description=f"Auto-approved: {action.description}",
-                permission_level=action.required_level.value,
+                description=f"Auto-approved: {description}",
+                permission_level=required_level.value,
                 user_approved=True,
                 status=ActionStatus.APPROVED,
-                result="Auto-approved action"
+                result="Auto-approved action",
+                metadata=self._decision_metadata(action_type, target)
             )
             return ActionResult(
                 success=True,
@@ -219,8 +517,12 @@ class PermissionManager:
                 dry_run=dry_run
             )
         
+        # Read and dry-run decisions change nothing, so they aren't logged
+        
         # For READ level, always approve
-        if action.required_level == PermissionLevel.READ:
+        if required_level is PermissionLevel.READ:
+            if not dry_run:
+                return _READ_APPROVED_RESULT
             return ActionResult(
                 success=True,
                 status="APPROVED",
@@ -229,7 +531,7 @@ class PermissionManager:
             )
         
         # For SUGGEST level (dry-run), approve but mark as dry-run
-        if action.required_level == PermissionLevel.SUGGEST or dry_run:
+        if required_level == PermissionLevel.SUGGEST or dry_run:
             return ActionResult(
                 success=True,
                 status="DRY_RUN",
@@ -238,28 +540,101 @@ class PermissionManager:
             )
         
         # For higher levels, request approval
+        if action is None:
+            action = ActionRequest(
+                action_type=action_type,
+                description=description,
+                target=target,
+                required_level=required_level
+            )
         return self._request_approval(action, dry_run)
     
+    def _decision_metadata(self, action_type: str, target: Optional[str], **extra: Any) -> Dict[str, Any]:
+        """
+        Build the metadata for the single log entry of a permission decision.
+        
+        Args:
+            action_type: Type of the action that was decided
+            target: Target of the action, if any
+            **extra: Additional fields to include
+        """
+        metadata = {
+            "action_type": action_type,
+            "target": target,
+            "pre_state": "PENDING",
+        }
+        metadata.update(extra)
+        return metadata
+    
+    def _classify_uncached(
+        self,
+        action_type: str,
+        target: Optional[str],
+        description: str
+    ) -> str:
+        """
+        Classify an action against the blacklist and auto-approve patterns.
+        
+        Only depends on the pattern lists, so results are cached per
+        (action_type, target, description) in self._classify.
+        
+        Returns:
+            "BLACKLISTED", "AUTO" or "NEEDS_APPROVAL"
+        """
+        action = ActionRequest(action_type=action_type, description=description, target=target)
+        if self._is_blacklisted(action):
+            return "BLACKLISTED"
+        if self._is_auto_approved(action):
+            return "AUTO"
+        return "NEEDS_APPROVAL"
+    
     def _is_blacklisted(self, action: ActionRequest) -> bool:
         """Check if an action matches any blacklist pattern."""
-        for pattern in self.blacklist:
-            # Check action type
-            if action.matches_pattern(pattern):
+        # Check action type
+        action_type = os.path.normcase(action.action_type)
+        if action_type in self._blacklist_literals:
+            return True
+        bucket = self._blacklist_glob_buckets.get(action_type.partition("_")[0])
+        if bucket is not None and bucket.match(action_type):
+            return True
+        if self._blacklist_globs is not None and self._blacklist_globs.match(action_type):
+            return True
+        
+        target = action.target.lower() if action.target else None
+        description = action.description.lower()
+        
+        automaton = self._blacklist_automaton
+        if automaton is not None:
+            # Check target/command, then description
+            if target and next(automaton.iter(target), None) is not None:
                 return True
+            return next(automaton.iter(description), None) is not None
+        
+        grams = self._blacklist_grams
+        if grams is not None:
+            if target and not _has_any_gram(target, grams):
+                target = None
+            if not _has_any_gram(description, grams):
+                if target is None:
+                    return False
+                description = ""
+        
+        for token in self._blacklist_tokens:
             # Check target/command
-            if action.target and pattern.lower() in action.target.lower():
+            if target and token in target:
                 return True
             # Check description
-            if pattern.lower() in action.description.lower():
+            if token in description:
                 return True
         return False
     
     def _is_auto_approved(self, action: ActionRequest) -> bool:
         """Check if an action matches any auto-approve pattern."""
-        for pattern in self.auto_approve:
-            if action.matches_pattern(pattern):
-                return True
-        return False
+        action_type = os.path.normcase(action.action_type)
+        if action_type in self._auto_approve_literals:
+            return True
+        globs = self._auto_approve_globs
+        return globs is not None and globs.match(action_type) is not None
     
     def _request_approval(self, action: ActionRequest, dry_run: bool) -> ActionResult:
         """
@@ -284,7 +659,7 @@ class PermissionManager:
             permission_level=action.required_level.value,
             user_approved=approved,
             status=status,
-            metadata={"preview": preview}
+            metadata=self._decision_metadata(action.action_type, action.target, preview=preview)
         )
         
         return ActionResult(
@@ -335,7 +710,8 @@ class PermissionManager:
             description=f"CLI {'approved' if approved else 'denied'}: {action.description}",
             permission_level=action.required_level.value,
             user_approved=approved,
-            status=status
+            status=status,
+            metadata=self._decision_metadata(action.action_type, action.target)
         )
         
         return ActionResult(
@@ -347,25 +723,22 @@ class PermissionManager:
     
     def _generate_preview(self, action: ActionRequest) -> str:
         """Generate a preview of what the action would do."""
-        lines = []
-        
-        if action.action_type.startswith("delete"):
-            lines.append(f"⚠️  This will DELETE: {action.target}")
-        elif action.action_type.startswith("write"):
-            lines.append(f"📝 This will WRITE to: {action.target}")
-        elif action.action_type.startswith("execute"):
-            lines.append(f"🖥️  This will EXECUTE: {action.target}")
-        elif action.action_type.startswith("move"):
-            lines.append(f"📦 This will MOVE: {action.target}")
-        else:
-            lines.append(f"🔧 This will perform: {action.description}")
-        
-        if action.parameters:
-            lines.append("\nParameters:")
-            for key, value in action.parameters.items():
-                lines.append(f"  - {key}: {value}")
-        
-        return "\n".join(lines)
+        fields = {"target": action.target, "description": action.description}
+        template = self._PREVIEW_TEMPLATES_BY_TOKEN.get(action.action_type.partition("_")[0])
+        if template is None:
+            # Prefixes without an underscore boundary, e.g. "writefile"
+            for prefix, template in self._PREVIEW_TEMPLATES:
+                if action.action_type.startswith(prefix):
+                    break
+            else:
+                template = self._DEFAULT_PREVIEW_TEMPLATE
+        summary = template.format_map(fields)
+        
+        if not action.parameters:
+            return summary
+        
+        parameters = "\n".join(f"  - {key}: {value}" for key, value in action.parameters.items())
+        return f"{summary}\n\nParameters:\n{parameters}"
     
     def add_to_whitelist(self, pattern: str, level: PermissionLevel) -> None:
         """
@@ -390,8 +763,8 @@ class PermissionManager:
         Args:
             pattern: Pattern to blacklist
         """
-        if pattern not in self.blacklist:
-            self.blacklist.append(pattern)
+        if pattern not in self._blacklist:
+            self.blacklist = self._blacklist + (pattern,)
             self.logger.log_action(
                 action_type=ActionType.PERMISSION,
                 description=f"Added to blacklist: {pattern}",
@@ -409,8 +782,8 @@ class PermissionManager:
         Returns:
             True if removed, False if not found
         """
-        if pattern in self.blacklist:
-            self.blacklist.remove(pattern)
+        if pattern in self._blacklist:
+            self.blacklist = tuple(p for p in self._blacklist if p != pattern)
             self.logger.log_action(
                 action_type=ActionType.PERMISSION,
                 description=f"Removed from blacklist: {pattern}",
@@ -429,22 +802,33 @@ class PermissionManager:
         config = {
             "friday": {
                 "permissions": {
-                    "auto_approve": self.auto_approve,
-                    "blacklist": self.blacklist,
+                    "auto_approve": list(self._auto_approve),
+                    "blacklist": list(self._blacklist),
                 }
             }
         }
         
+        yaml, loader, dumper = _yaml()
+        
         # Merge with existing config
+        existing_bytes = None
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    existing = yaml.safe_load(f) or {}
-                    if "friday" in existing:
-                        existing["friday"]["permissions"] = config["friday"]["permissions"]
-                        config = existing
+                existing_bytes = self.config_path.read_bytes()
+                existing = yaml.load(existing_bytes, Loader=loader) or {}
+                if "friday" in existing:
+                    existing["friday"]["permissions"] = config["friday"]["permissions"]
+                    config = existing
             except Exception:
                 pass
         
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        new_bytes = yaml.dump(config, Dumper=dumper, default_flow_style=False).encode("utf-8")
+        if new_bytes == existing_bytes:
+            return
+        
+        # Write a sibling and swap it in so readers never see a partial file
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(new_bytes)
+        os.replace(tmp_path, self.config_path)
+        
+        self._config_cache_path.unlink(missing_ok=True)
@@ -5,25 +5,43 @@ Friday - Offline Personal Assistant
 Main entry point for the Friday CLI application.
 """
 
+import functools
+
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+
+# rich and core are imported where they are used, so commands like
+# --version or --help don't pay for importing them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from core import PermissionManager, OllamaClient, AuditLogger
+
 
-from core import PermissionManager, PermissionLevel, OllamaClient, AuditLogger
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Get the shared rich console."""
+    from rich.console import Console
+    return Console()
 
 
-console = Console()
+@functools.lru_cache(maxsize=1)
+def get_audit_logger() -> "AuditLogger":
+    """Get the shared audit logger instance."""
+    from core import AsyncAuditLogger
+    return AsyncAuditLogger()
 
 
-def get_permission_manager() -> PermissionManager:
-    """Get a configured permission manager instance."""
-    return PermissionManager(config_path="config.yaml")
+@functools.lru_cache(maxsize=1)
+def get_permission_manager() -> "PermissionManager":
+    """Get the shared permission manager instance."""
+    from core import PermissionManager
+    return PermissionManager(config_path="config.yaml", logger=get_audit_logger())
 
 
-def get_ollama_client() -> OllamaClient:
-    """Get a configured Ollama client instance."""
+@functools.lru_cache(maxsize=1)
+def get_ollama_client() -> "OllamaClient":
+    """Get the shared Ollama client instance."""
+    from core import OllamaClient
     return OllamaClient()
 
 
@@ -42,6 +60,9 @@ def friday():
 @friday.command()
 def status():
     """Show Friday's current status."""
+    from rich.panel import Panel
+    console = _console()
+    
     console.print(Panel.fit(
         "[bold blue]Friday - Offline Personal Assistant[/bold blue]\n"
         "[dim]Version 0.1.0[/dim]",
@@ -71,6 +92,8 @@ def status():
 @click.argument("prompt", nargs=-1, required=True)
 def ask(prompt):
     """Ask Friday a question."""
+    console = _console()
+    
     prompt_text = " ".join(prompt)
     
     console.print(f"\n[dim]You:[/dim] {prompt_text}\n")
@@ -91,11 +114,21 @@ def ask(prompt):
     console.print(f"[bold blue]Friday:[/bold blue] {response}")
 
 
+_STATUS_MARKUP = {
+    "approved": "[green]approved[/green]",
+    "denied": "[red]denied[/red]",
+}
+_APPROVED_GLYPHS = {True: "✅", False: "❌", None: "—"}
+
+
 @friday.command()
 def audit():
     """View the audit log."""
-    logger = AuditLogger()
-    entries = logger.get_recent(limit=20)
+    from rich.table import Table
+    console = _console()
+    
+    logger = get_audit_logger()
+    entries = logger.get_recent_rows(limit=20)
     
     if not entries:
         console.print("[dim]No audit entries found.[/dim]")
@@ -107,26 +140,18 @@ def audit():
     table.add_column("Status")
     table.add_column("Approved")
     
-    for entry in entries:
-        # Format timestamp
-        time_str = entry.timestamp.split("T")[1].split(".")[0] if "T" in entry.timestamp else entry.timestamp
-        
-        # Status color
-        status_str = entry.status
-        if entry.status == "approved":
-            status_str = f"[green]{entry.status}[/green]"
-        elif entry.status == "denied":
-            status_str = f"[red]{entry.status}[/red]"
-        
-        # Approved indicator
-        approved_str = "✅" if entry.user_approved else "❌" if entry.user_approved is False else "—"
-        
-        table.add_row(
-            time_str,
-            entry.action_description[:50] + "..." if len(entry.action_description) > 50 else entry.action_description,
-            status_str,
-            approved_str
+    rows = [
+        (
+            # Time of day from the ISO timestamp
+            timestamp.split("T")[1].split(".")[0] if "T" in timestamp else timestamp,
+            description[:50] + "..." if len(description) > 50 else description,
+            _STATUS_MARKUP.get(status, status),
+            _APPROVED_GLYPHS.get(user_approved, "—"),
         )
+        for timestamp, description, status, user_approved in entries
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -140,6 +165,8 @@ def permission():
 @permission.command("list")
 def permission_list():
     """List current permission settings."""
+    console = _console()
+    
     pm = get_permission_manager()
     
     console.print("\n[bold]Auto-Approved Actions:[/bold]")
@@ -155,6 +182,8 @@ def permission_list():
 @click.argument("pattern")
 def permission_blacklist(pattern: str):
     """Add a pattern to the blacklist."""
+    console = _console()
+    
     pm = get_permission_manager()
     pm.add_to_blacklist(pattern)
     pm.save_config()
@@ -165,6 +194,9 @@ def permission_blacklist(pattern: str):
 @click.argument("pattern")
 def permission_whitelist(pattern: str):
     """Add a pattern to auto-approve list."""
+    from core import PermissionLevel
+    console = _console()
+    
     pm = get_permission_manager()
     pm.add_to_whitelist(pattern, PermissionLevel.SAFE_WRITE)
     pm.save_config()
@@ -174,6 +206,8 @@ def permission_whitelist(pattern: str):
 @friday.command()
 def models():
     """List available Ollama models."""
+    console = _console()
+    
     client = get_ollama_client()
     
     if not client.is_available():
@@ -197,6 +231,8 @@ def models():
 @click.argument("model_name")
 def use(model_name: str):
     """Switch to a different model."""
+    console = _console()
+    
     client = get_ollama_client()
     
     if client.switch_model(model_name):
@@ -209,6 +245,9 @@ def use(model_name: str):
 @friday.command()
 def chat():
     """Start an interactive chat session."""
+    from rich.panel import Panel
+    console = _console()
+    
     console.print(Panel.fit(
         "[bold blue]Friday Chat[/bold blue]\n"
         "[dim]Type 'exit' or 'quit' to end the session[/dim]",
@@ -226,6 +265,10 @@ You help with tasks, file organization, and productivity.
 Be concise, practical, and safety-conscious.
 Never suggest actions that could harm the user's system without explicit warnings."""
     
+    # Load the model now rather than on the first message
+    with console.status("[bold green]Loading model..."):
+        client.warm_up()
+    
     while True:
         try:
             user_input = console.input("\n[bold green]You>[/bold green] ").strip()
@@ -0,0 +1,669 @@
+"""
+Tests for the Audit Logger module.
+"""
+
+import csv
+import dataclasses
+import errno
+import gc
+import io
+import json
+import pytest
+import threading
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.logger import AuditLogger, AsyncAuditLogger, AuditEntry, ActionType, ActionStatus
+from core.logger import _UNKNOWN_TS, _fast_timestamp, _timestamp_ns
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Path to a temporary audit log file."""
+    return tmp_path / "audit_log.jsonl"
+
+
+@pytest.fixture
+def logger(log_path):
+    """Provides a logger that writes to a temporary directory."""
+    audit_logger = AuditLogger(log_path=str(log_path))
+    yield audit_logger
+    audit_logger.close()
+
+
+class TestBufferedWrites:
+    """Test batched writes to the audit log."""
+
+    def test_entries_buffered_until_flush(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), flush_interval=60)
+        logger.log_action(ActionType.READ, "Buffered action", permission_level=0)
+
+        assert log_path.read_text() == ""
+
+        logger.flush()
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert AuditEntry.from_json(lines[0]).action_description == "Buffered action"
+        logger.close()
+
+    def test_threshold_triggers_write(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), flush_threshold=1, flush_interval=60)
+        logger.log_action(ActionType.READ, "Immediate action", permission_level=0)
+
+        assert "Immediate action" in log_path.read_text()
+        logger.close()
+
+    def test_idle_buffer_written_after_interval(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), flush_interval=0.05)
+        logger.log_action(ActionType.PERMISSION, "Quiet denial", permission_level=4, status=ActionStatus.DENIED)
+
+        deadline = time.monotonic() + 5
+        while "Quiet denial" not in log_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "Quiet denial" in log_path.read_text()
+        logger.close()
+
+    def test_close_flushes_pending_entries(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), flush_interval=60)
+        logger.log_action(ActionType.WRITE, "Pending action", permission_level=2)
+        logger.close()
+
+        assert "Pending action" in log_path.read_text()
+
+    def test_log_after_close_raises(self, log_path):
+        logger = AuditLogger(log_path=str(log_path))
+        logger.close()
+
+        with pytest.raises(ValueError):
+            logger.log_action(ActionType.WRITE, "Too late", permission_level=2)
+        assert logger._flush_timer is None
+
+    def test_unreferenced_logger_is_collected(self, log_path):
+        logger = AuditLogger(log_path=str(log_path))
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+
+        assert ref() is None
+
+    def test_reads_see_buffered_entries(self, logger):
+        logger.log_action(
+            ActionType.EXECUTE,
+            "Denied action",
+            permission_level=4,
+            status=ActionStatus.DENIED
+        )
+
+        assert len(logger.get_recent()) == 1
+        assert len(logger.get_denied_actions()) == 1
+
+
+class TestGetRecent:
+    """Test reading the tail of the audit log."""
+
+    def test_returns_most_recent_first(self, logger):
+        for i in range(5):
+            logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        entries = logger.get_recent(limit=3)
+
+        assert [e.action_description for e in entries] == ["Action 4", "Action 3", "Action 2"]
+
+    def test_tail_spans_multiple_blocks(self, logger, monkeypatch):
+        monkeypatch.setattr("core.logger._TAIL_BLOCK_SIZE", 64)
+        for i in range(50):
+            logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        entries = logger.get_recent(limit=20)
+
+        assert len(entries) == 20
+        assert entries[0].action_description == "Action 49"
+        assert entries[-1].action_description == "Action 30"
+
+    def test_limit_larger_than_log(self, logger):
+        logger.log_action(ActionType.READ, "Only action", permission_level=0)
+
+        entries = logger.get_recent(limit=100)
+
+        assert len(entries) == 1
+
+    def test_recent_rows(self, logger):
+        logger.log_action(ActionType.READ, "First", permission_level=0, user_approved=True)
+        logger.log_action(ActionType.WRITE, "Second", permission_level=2, status=ActionStatus.DENIED)
+
+        rows = logger.get_recent_rows(limit=5)
+
+        assert [row[1:] for row in rows] == [("Second", "denied", None), ("First", "pending", True)]
+        assert rows[0][0] == logger.get_recent(limit=1)[0].timestamp
+
+    def test_iter_recent_is_lazy(self, logger, monkeypatch):
+        monkeypatch.setattr("core.logger._TAIL_BLOCK_SIZE", 64)
+        for i in range(50):
+            logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        recent = logger.iter_recent()
+
+        assert next(recent).action_description == "Action 49"
+        assert next(recent).action_description == "Action 48"
+        assert len(list(recent)) == 48
+
+    def test_skips_corrupt_lines(self, logger, log_path):
+        logger.log_action(ActionType.READ, "Before", permission_level=0)
+        logger.flush()
+        with open(log_path, "a") as f:
+            f.write("not json\n\n")
+        logger.log_action(ActionType.READ, "After", permission_level=0)
+
+        assert [e.action_description for e in logger.get_recent()] == ["After", "Before"]
+
+
+class TestFilteredScans:
+    """Test the filtered scans over the full audit log."""
+
+    def test_get_by_action_type(self, logger):
+        logger.log_action(ActionType.READ, "Read something", permission_level=0)
+        logger.log_action(ActionType.WRITE, "Write something", permission_level=2)
+        logger.log_action(ActionType.READ, "Mentions \"write\" in text", permission_level=0)
+
+        entries = logger.get_by_action_type(ActionType.WRITE)
+
+        assert [e.action_description for e in entries] == ["Write something"]
+
+    def test_get_by_action_type_respects_limit(self, logger):
+        for i in range(5):
+            logger.log_action(ActionType.DELETE, f"Delete {i}", permission_level=6)
+
+        assert len(logger.get_by_action_type(ActionType.DELETE, limit=2)) == 2
+
+    def test_get_by_date(self, logger):
+        entry = logger.log_action(ActionType.READ, "Today", permission_level=0)
+        today = datetime.fromisoformat(entry.timestamp)
+
+        assert len(logger.get_by_date(today)) == 1
+        assert logger.get_by_date(datetime(2000, 1, 1)) == []
+
+    def test_get_by_date_ignores_date_in_other_fields(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), use_index=False)
+        entry = logger.log_action(ActionType.READ, "Read report-2000-01-01.txt", permission_level=0)
+        logger.flush()
+        with open(log_path, "a") as f:
+            # Line in the older, non-compact layout
+            old = json.dumps({**dataclasses.asdict(entry), "timestamp": "2000-01-01T09:00:00.000000"})
+            f.write(old + "\n")
+
+        entries = logger.get_by_date(datetime(2000, 1, 1))
+        logger.close()
+
+        assert [e.timestamp for e in entries] == ["2000-01-01T09:00:00.000000"]
+
+    def test_scans_on_empty_log(self, logger):
+        assert logger.get_by_date(datetime.now()) == []
+        assert logger.get_by_action_type(ActionType.READ) == []
+        assert logger.get_denied_actions() == []
+
+
+class TestAuditEntry:
+    """Test AuditEntry construction and serialization."""
+
+    def test_timestamp_is_iso_format(self):
+        before = datetime.now()
+        entry = AuditEntry.create(ActionType.READ, "Timestamped", permission_level=0)
+        after = datetime.now()
+
+        timestamp = datetime.fromisoformat(entry.timestamp)
+        assert before.replace(microsecond=0) <= timestamp <= after
+        assert len(entry.timestamp) == len("2024-01-01T00:00:00.000000")
+
+    def test_json_round_trip(self):
+        entry = AuditEntry.create(
+            ActionType.WRITE,
+            "Write \"quoted\", ünïcode",
+            permission_level=2,
+            user_approved=True,
+            status=ActionStatus.SUCCESS,
+            metadata={"bytes_written": 12}
+        )
+
+        assert AuditEntry.from_json(entry.to_json()) == entry
+        assert entry.to_bytes() == entry.to_json().encode("utf-8")
+
+    @pytest.mark.parametrize("line", ["not json", b"{\"timestamp\": "])
+    def test_from_json_raises_json_decode_error(self, line):
+        with pytest.raises(json.JSONDecodeError):
+            AuditEntry.from_json(line)
+
+
+class TestSidecarIndex:
+    """Test the sidecar offset index used by date and action type queries."""
+
+    def test_index_written_alongside_log(self, logger, log_path):
+        logger.log_action(ActionType.READ, "Indexed", permission_level=0)
+        logger.flush()
+
+        assert log_path.with_name(log_path.name + ".idx").exists()
+        assert logger._index.count == 1
+
+    def test_index_appended_after_log_is_written(self, logger, log_path, monkeypatch):
+        log_sizes = []
+        append = logger._index.append
+        def checked_append(records):
+            log_sizes.append((log_path.stat().st_size, records[-1][0] + records[-1][1] + 1))
+            append(records)
+        monkeypatch.setattr(logger._index, "append", checked_append)
+
+        logger.log_action(ActionType.READ, "Ordered", permission_level=0)
+        logger.flush()
+
+        assert log_sizes and all(size >= end for size, end in log_sizes)
+
+    def test_index_rebuilt_when_missing(self, log_path):
+        first = AuditLogger(log_path=str(log_path))
+        first.log_action(ActionType.WRITE, "Before index", permission_level=2)
+        first.close()
+        log_path.with_name(log_path.name + ".idx").unlink()
+
+        second = AuditLogger(log_path=str(log_path))
+        entries = second.get_by_action_type(ActionType.WRITE)
+        second.close()
+
+        assert [e.action_description for e in entries] == ["Before index"]
+
+    def test_index_catches_up_with_other_writers(self, logger, log_path):
+        other = AuditLogger(log_path=str(log_path))
+        other.log_action(ActionType.DELETE, "From other logger", permission_level=6)
+        other.close()
+        logger.log_action(ActionType.DELETE, "From this logger", permission_level=6)
+
+        entries = logger.get_by_action_type(ActionType.DELETE)
+
+        assert [e.action_description for e in entries] == ["From other logger", "From this logger"]
+
+    def test_concurrent_loggers_share_index(self, log_path):
+        loggers = [AuditLogger(log_path=str(log_path), flush_threshold=0) for _ in range(2)]
+
+        def write_entries(audit_logger):
+            for i in range(1000):
+                audit_logger.log_action(ActionType.WRITE, f"Write {i}", permission_level=2)
+                audit_logger.log_action(ActionType.READ, f"Read {i}", permission_level=0)
+
+        threads = [threading.Thread(target=write_entries, args=(audit_logger,)) for audit_logger in loggers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entries = loggers[0].get_by_action_type(ActionType.WRITE, limit=10_000)
+        for audit_logger in loggers:
+            audit_logger.close()
+
+        assert loggers[0]._index.count == 4000
+        assert len(entries) == 2000
+        assert all(e.action_type == ActionType.WRITE.value for e in entries)
+
+    def test_failed_write_keeps_index_fields(self, logger, log_path):
+        class FullDisk:
+            def __init__(self, fh):
+                self.fh = fh
+
+            def write(self, data):
+                raise OSError(errno.ENOSPC, "No space left on device")
+
+            def __getattr__(self, name):
+                return getattr(self.fh, name)
+
+        fh = logger._fh
+        logger._fh = FullDisk(fh)
+        with pytest.raises(OSError):
+            logger.log_action(ActionType.DELETE, "Retried", permission_level=6)
+            logger.flush()
+        logger._fh = fh
+        logger.flush()
+
+        assert logger._index.count == 1
+        entries = logger.get_by_action_type(ActionType.DELETE)
+        assert [e.action_description for e in entries] == ["Retried"]
+
+    def test_index_named_after_full_log_name(self, tmp_path):
+        jsonl = AuditLogger(log_path=str(tmp_path / "audit.jsonl"))
+        log = AuditLogger(log_path=str(tmp_path / "audit.log"))
+        jsonl.log_action(ActionType.READ, "JSONL", permission_level=0)
+        log.log_action(ActionType.READ, "Plain", permission_level=0)
+        jsonl.close()
+        log.close()
+
+        assert (tmp_path / "audit.jsonl.idx").exists()
+        assert (tmp_path / "audit.log.idx").exists()
+
+    def test_denied_actions_since(self, logger, log_path):
+        old = AuditEntry.create(ActionType.EXECUTE, "Old denial", permission_level=4, status=ActionStatus.DENIED)
+        old.timestamp = "2020-01-01T00:00:00.000000"
+        logger.log(old)
+        logger.log_action(ActionType.EXECUTE, "Approved", permission_level=4, status=ActionStatus.APPROVED)
+        logger.log_action(ActionType.EXECUTE, "New denial", permission_level=4, status=ActionStatus.DENIED)
+
+        assert len(logger.get_denied_actions()) == 2
+        recent = logger.get_denied_actions(since=datetime(2024, 1, 1))
+        assert [e.action_description for e in recent] == ["New denial"]
+
+        unindexed = AuditLogger(log_path=str(log_path), use_index=False)
+        recent = unindexed.get_denied_actions(since=datetime(2024, 1, 1))
+        unindexed.close()
+        assert [e.action_description for e in recent] == ["New denial"]
+
+    def test_out_of_order_timestamps_fall_back_to_full_scan(self, logger, log_path):
+        for description, timestamp in [
+            ("a", "2030-01-01T12:00:00.000000"),
+            ("c", "2030-01-02T00:00:01.000000"),
+            ("b", "2030-01-01T11:00:00.000000"),
+        ]:
+            entry = AuditEntry.create(ActionType.EXECUTE, description, permission_level=4, status=ActionStatus.DENIED)
+            entry.timestamp = timestamp
+            logger.log(entry)
+
+        indexed = logger.get_by_date(datetime(2030, 1, 1))
+        denied = logger.get_denied_actions(since=datetime(2030, 1, 1, 11, 30))
+
+        unindexed = AuditLogger(log_path=str(log_path), use_index=False)
+        scanned = unindexed.get_by_date(datetime(2030, 1, 1))
+        unindexed.close()
+        assert not logger._index.sorted
+        assert [e.action_description for e in indexed] == ["a", "b"]
+        assert [e.action_description for e in scanned] == ["a", "b"]
+        assert [e.action_description for e in denied] == ["a", "c"]
+
+    def test_index_order_checked_for_other_writers(self, logger, log_path):
+        other = AuditLogger(log_path=str(log_path))
+        entry = AuditEntry.create(ActionType.READ, "Old", permission_level=0)
+        entry.timestamp = "2000-01-01T00:00:00.000000"
+        other.log_action(ActionType.READ, "Now", permission_level=0)
+        other.log(entry)
+        other.close()
+
+        assert [e.action_description for e in logger.get_by_date(datetime(2000, 1, 1))] == ["Old"]
+        assert not logger._index.sorted
+
+    def test_timestamp_ns_of_generated_timestamp(self):
+        timestamp = _fast_timestamp()
+
+        parsed = int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000) * 1000
+
+        assert abs(_timestamp_ns(timestamp) - parsed) <= 1000
+        assert _timestamp_ns("yesterday") == _UNKNOWN_TS
+
+    def test_non_iso_timestamp_is_logged(self, logger):
+        entry = AuditEntry.create(ActionType.READ, "Custom time", permission_level=0)
+        entry.timestamp = "yesterday"
+
+        logger.log(entry)
+        logger.flush()
+
+        assert logger.get_recent(limit=1)[0].timestamp == "yesterday"
+        assert logger.get_by_date(datetime.now()) == []
+
+    def test_index_with_old_layout_rebuilt(self, log_path):
+        first = AuditLogger(log_path=str(log_path))
+        first.log_action(ActionType.EXECUTE, "Denied", permission_level=4, status=ActionStatus.DENIED)
+        first.close()
+        log_path.with_name(log_path.name + ".idx").write_bytes(b"FRIDX\x00\x00\x01" + b"\x00" * 24)
+
+        second = AuditLogger(log_path=str(log_path))
+        entries = second.get_denied_actions()
+        second.close()
+
+        assert [e.action_description for e in entries] == ["Denied"]
+
+    def test_queries_without_index(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), use_index=False)
+        entry = logger.log_action(ActionType.WRITE, "Unindexed", permission_level=2)
+
+        assert len(logger.get_by_action_type(ActionType.WRITE)) == 1
+        assert len(logger.get_by_date(datetime.fromisoformat(entry.timestamp))) == 1
+        assert not log_path.with_name(log_path.name + ".idx").exists()
+        logger.close()
+
+
+class TestTemplateCache:
+    """Test pre-encoded templates for repeated entries."""
+
+    @pytest.fixture(autouse=True)
+    def stdlib_json(self, monkeypatch):
+        """Force the stdlib JSON encoder, which is the only one using templates."""
+        monkeypatch.setattr("core.logger.orjson", None)
+        monkeypatch.setattr(
+            "core.logger._dumps",
+            lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+
+    def test_template_encoding_matches_full_encoding(self, logger):
+        entry = AuditEntry.create(
+            ActionType.PERMISSION,
+            "Permission check: read",
+            permission_level=0,
+            metadata={"target": "/tmp/ü.txt"}
+        )
+
+        assert logger._encode(entry) == entry.to_bytes()
+        assert logger._encode(entry) == entry.to_bytes()
+        assert len(logger._template_cache) == 1
+
+    def test_template_cache_is_bounded(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), template_cache_size=2)
+        for i in range(5):
+            logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        assert len(logger._template_cache) == 2
+        assert len(logger.get_recent()) == 5
+        logger.close()
+
+
+class TestClear:
+    """Test clearing the audit log."""
+
+    def test_requires_confirmation(self, logger):
+        logger.log_action(ActionType.READ, "Kept", permission_level=0)
+
+        assert not logger.clear()
+        assert len(logger.get_recent()) == 1
+
+    def test_backs_up_and_keeps_file_handle(self, logger, log_path):
+        logger.log_action(ActionType.READ, "Before clear", permission_level=0)
+        fh = logger._fh
+        inode = log_path.stat().st_ino
+
+        assert logger.clear(confirm=True)
+        logger.log_action(ActionType.WRITE, "After clear", permission_level=2)
+
+        backups = list(log_path.parent.glob("audit_log.backup.*.jsonl"))
+        assert len(backups) == 1
+        assert "Before clear" in backups[0].read_text()
+        assert logger._fh is fh
+        assert log_path.stat().st_ino == inode
+        assert [e.action_description for e in logger.get_recent()] == ["After clear"]
+        assert [e.action_description for e in logger.get_by_action_type(ActionType.WRITE)] == ["After clear"]
+
+    def test_concurrent_logging_loses_nothing(self, log_path):
+        logger = AuditLogger(log_path=str(log_path), flush_threshold=1)
+
+        def write_entries(n):
+            for i in range(200):
+                logger.log_action(ActionType.READ, f"Thread {n} action {i}", permission_level=0)
+
+        threads = [threading.Thread(target=write_entries, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        logger.clear(confirm=True)
+        for thread in threads:
+            thread.join()
+        logger.close()
+
+        backups = list(log_path.parent.glob("audit_log.backup.*.jsonl"))
+        lines = log_path.read_text().splitlines()
+        for backup in backups:
+            lines += backup.read_text().splitlines()
+        assert len(lines) == 800
+        assert all(AuditEntry.from_json(line) for line in lines)
+
+
+class TestExport:
+    """Test exporting the audit log."""
+
+    def test_csv_quotes_commas_and_quotes(self, logger):
+        logger.log_action(ActionType.WRITE, 'Wrote "a, b"', permission_level=2, user_approved=True, result="ok, done")
+
+        rows = list(csv.reader(io.StringIO(logger.export(format="csv"))))
+
+        assert rows[0][:3] == ["timestamp", "action_type", "action_description"]
+        assert rows[1][1:] == ["write", 'Wrote "a, b"', "2", "True", "pending", "ok, done"]
+
+    def test_json_matches_entries(self, logger):
+        logger.log_action(ActionType.READ, "First", permission_level=0, metadata={"n": 1})
+        logger.log_action(ActionType.WRITE, "Second", permission_level=2)
+
+        exported = json.loads(logger.export(format="json"))
+
+        assert [AuditEntry(**record) for record in exported] == logger.get_recent()
+        assert exported == logger.get_recent_raw()
+
+    def test_csv_to_file(self, logger, tmp_path):
+        logger.log_action(ActionType.READ, "Exported", permission_level=0)
+        export_path = tmp_path / "export.csv"
+
+        with open(export_path, "w", newline="") as f:
+            assert logger.export(format="csv", file=f) == ""
+
+        assert len(export_path.read_text().splitlines()) == 2
+
+    def test_unsupported_format(self, logger):
+        with pytest.raises(ValueError):
+            logger.export(format="xml")
+
+
+class TestAsyncAuditLogger:
+    """Test logging through the background worker thread."""
+
+    @pytest.fixture
+    def async_logger(self, log_path):
+        audit_logger = AsyncAuditLogger(log_path=str(log_path))
+        yield audit_logger
+        audit_logger.close()
+
+    def test_reads_see_queued_entries(self, async_logger):
+        for i in range(100):
+            async_logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        entries = async_logger.get_recent(limit=200)
+
+        assert len(entries) == 100
+        assert entries[0].action_description == "Action 99"
+
+    def test_close_drains_queue(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), flush_interval=60)
+        for i in range(50):
+            async_logger.log_action(ActionType.WRITE, f"Action {i}", permission_level=2)
+        async_logger.close()
+
+        assert len(log_path.read_text().splitlines()) == 50
+
+    def test_worker_started_by_first_log(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path))
+        assert async_logger._worker is None
+
+        async_logger.log_action(ActionType.READ, "First", permission_level=0)
+
+        assert async_logger._worker.is_alive()
+        async_logger.close()
+        assert not async_logger._worker.is_alive()
+
+    def test_log_after_close_raises(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), queue_size=5)
+        async_logger.log_action(ActionType.READ, "First", permission_level=0)
+        async_logger.close()
+
+        for i in range(10):
+            with pytest.raises(ValueError):
+                async_logger.log_action(ActionType.READ, f"Too late {i}", permission_level=0)
+        assert async_logger._queue.empty()
+
+    def test_threshold_flushes_while_draining(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), flush_threshold=1)
+        for i in range(3000):
+            async_logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+
+        async_logger.flush()
+
+        assert async_logger._worker.is_alive()
+        assert len(log_path.read_text().splitlines()) == 3000
+        async_logger.close()
+
+    def test_unserializable_entry_raises_in_caller(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), queue_size=5)
+        with pytest.raises(TypeError):
+            async_logger.log_action(ActionType.READ, "Bad", permission_level=0, metadata={"obj": object()})
+
+        for i in range(20):
+            async_logger.log_action(ActionType.READ, f"Action {i}", permission_level=0)
+        async_logger.close()
+
+        assert len(log_path.read_text().splitlines()) == 20
+
+    def test_write_error_raised_by_flush(self, log_path, monkeypatch):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), flush_threshold=1)
+        write_buffer = AuditLogger._write_buffer
+        failures = []
+
+        def fail_once(self):
+            if not failures:
+                failures.append(True)
+                raise OSError("disk full")
+            write_buffer(self)
+
+        monkeypatch.setattr(AuditLogger, "_write_buffer", fail_once)
+        async_logger.log_action(ActionType.READ, "First", permission_level=0)
+        deadline = time.monotonic() + 5
+        while not failures and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert async_logger._worker.is_alive()
+        with pytest.raises(OSError):
+            async_logger.flush()
+        async_logger.log_action(ActionType.READ, "Second", permission_level=0)
+        async_logger.close()
+
+        assert [e.action_description for e in async_logger.get_recent()] == ["Second", "First"]
+
+    def test_worker_flushes_idle_buffer(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path), flush_interval=0.05)
+        async_logger.log_action(ActionType.READ, "Idle entry", permission_level=0)
+
+        deadline = time.monotonic() + 5
+        while "Idle entry" not in log_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        async_logger.close()
+
+        assert "Idle entry" in log_path.read_text()
+
+    def test_concurrent_logging_and_clear(self, log_path):
+        async_logger = AsyncAuditLogger(log_path=str(log_path))
+
+        def write_entries(n):
+            for i in range(200):
+                async_logger.log_action(ActionType.READ, f"Thread {n} action {i}", permission_level=0)
+
+        threads = [threading.Thread(target=write_entries, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        async_logger.clear(confirm=True)
+        for thread in threads:
+            thread.join()
+        async_logger.close()
+
+        lines = log_path.read_text().splitlines()
+        for backup in log_path.parent.glob("audit_log.backup.*.jsonl"):
+            lines += backup.read_text().splitlines()
+        assert len(lines) == 800
@@ -0,0 +1,227 @@
+"""
+Tests for the Ollama Client module.
+"""
+
+import json
+import pytest
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.ollama_client import OllamaClient, _ReasoningFilter, _strip_reasoning
+
+
+RAW_RESPONSE = "Thinking...\nLet me work this out.\n...done thinking.\n\nParis is the capital.\nIt is in France."
+
+
+class TestReasoningFilter:
+    """Test stripping the reasoning process from model output."""
+
+    def test_filter_whole_response(self):
+        client = OllamaClient()
+
+        assert client._filter_reasoning(RAW_RESPONSE) == "Paris is the capital.\nIt is in France."
+
+    def test_filter_returns_original_when_everything_removed(self):
+        client = OllamaClient()
+
+        assert client._filter_reasoning("Thinking...\nonly thoughts") == "Thinking...\nonly thoughts"
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_streamed_chunks_match_whole_response(self, chunk_size):
+        reasoning_filter = _ReasoningFilter()
+        chunks = [RAW_RESPONSE[i:i + chunk_size] for i in range(0, len(RAW_RESPONSE), chunk_size)]
+
+        output = "".join(reasoning_filter.feed(chunk) for chunk in chunks) + reasoning_filter.finish()
+
+        assert output.strip() == "Paris is the capital.\nIt is in France."
+
+    @pytest.mark.parametrize("text", [
+        RAW_RESPONSE,
+        "<think>\nstep one\n</think>\n\nAnswer",
+        "Intro\n<think>never closed\nmore",
+        "Thinking... and done thinking on one line\nstill thinking\n...done thinking.\nAnswer",
+        "No markers here\n\n  \nat all",
+        "İstanbul\nThinking...\nhmm\ndone thinking\nAnswer",
+    ])
+    def test_whole_text_strip_matches_line_filter(self, text):
+        reasoning_filter = _ReasoningFilter()
+        expected = (reasoning_filter.feed(text) + reasoning_filter.finish()).strip()
+
+        assert _strip_reasoning(text) == expected
+
+    def test_whole_text_strip_with_many_markers(self):
+        text = "\n".join(
+            line for i in range(4000) for line in ("<think>", f"step {i}", "</think>", f"Answer {i}")
+        )
+        reasoning_filter = _ReasoningFilter()
+        expected = (reasoning_filter.feed(text) + reasoning_filter.finish()).strip()
+
+        start = time.perf_counter()
+        stripped = _strip_reasoning(text)
+        elapsed = time.perf_counter() - start
+
+        assert stripped == expected
+        # Rescanning for markers that never occur made this quadratic
+        assert elapsed < 0.25
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Ollama HTTP API."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def _send_json(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path, None))
+        if self.path == "/api/version":
+            self._send_json({"version": "0.0.0"})
+        elif self.path == "/api/tags":
+            self._send_json({"models": [{"name": "deepseek-r1:1.5b"}, {"name": "llama2:latest"}]})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(("POST", self.path, payload))
+        if self.path == "/api/chat":
+            lines = [
+                {"message": {"role": "assistant", "content": "<think>\nhidden\n</think>\n"}, "done": False},
+                {"message": {"role": "assistant", "content": "Hello "}, "done": False},
+                {"message": {"role": "assistant", "content": "there"}, "done": False},
+                {"message": {"role": "assistant", "content": ""}, "done": True, "eval_count": 3, "total_duration": 10},
+            ]
+            data = b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        elif self.path == "/api/generate":
+            response = "<think>\nhidden\n</think>\nGenerated" if payload.get("prompt") else ""
+            self._send_json({"model": payload["model"], "response": response, "done": True})
+        elif self.path == "/api/show":
+            self._send_json({"details": {"family": "qwen2"}, "parameters": "temperature 0.6"})
+        elif self.path == "/api/pull":
+            self._send_json({"status": "success"})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def ollama_server():
+    """Run a fake Ollama API on a free local port."""
+    FakeOllamaHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpApi:
+    """Test talking to Ollama over its HTTP API."""
+
+    def test_is_available(self, ollama_server):
+        assert OllamaClient(host=ollama_server).is_available()
+
+    def test_not_available_when_server_down(self):
+        assert not OllamaClient(host="http://127.0.0.1:9").is_available()
+
+    def test_list_models(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        assert client.list_models() == ["deepseek-r1:1.5b", "llama2:latest"]
+
+    def test_chat(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        response = client.chat([{"role": "user", "content": "Hi"}], system_prompt="Be brief")
+
+        assert response.content == "Hello there"
+        assert response.eval_count == 3
+        _, path, payload = FakeOllamaHandler.requests[-1]
+        assert path == "/api/chat"
+        assert payload["messages"][0] == {"role": "system", "content": "Be brief"}
+        assert payload["keep_alive"] == "30m"
+
+    def test_chat_stream(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        assert "".join(client.chat_stream([{"role": "user", "content": "Hi"}])).strip() == "Hello there"
+
+    def test_connection_reused(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+        client.list_models()
+        connection = client._connection
+
+        client.chat([{"role": "user", "content": "Hi"}])
+
+        assert client._connection is connection
+
+    def test_list_models_cached(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        client.list_models()
+        assert client.model_exists("llama2")
+        assert client.switch_model("llama2:latest")
+
+        assert [r for r in FakeOllamaHandler.requests if r[1] == "/api/tags"] == [("GET", "/api/tags", None)]
+
+    def test_list_models_cache_expires(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+        client._models_ttl = 0
+
+        client.list_models()
+        client.list_models()
+
+        assert len([r for r in FakeOllamaHandler.requests if r[1] == "/api/tags"]) == 2
+
+    def test_get_model_info(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        info = client.get_model_info()
+
+        assert info["details"] == {"family": "qwen2"}
+        assert FakeOllamaHandler.requests[-1] == ("POST", "/api/show", {"model": "deepseek-r1:1.5b"})
+
+    def test_pull_model_clears_model_cache(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+        client.list_models()
+
+        assert client.pull_model("llama2")
+        assert client._models_cache is None
+        assert FakeOllamaHandler.requests[-1] == ("POST", "/api/pull", {"model": "llama2", "stream": False})
+
+    def test_warm_up_loads_model(self, ollama_server):
+        client = OllamaClient(host=ollama_server, keep_alive="1h")
+
+        assert client.warm_up()
+        assert FakeOllamaHandler.requests[-1] == (
+            "POST", "/api/generate", {"model": "deepseek-r1:1.5b", "keep_alive": "1h"}
+        )
+
+    def test_generate_uses_top_level_system(self, ollama_server):
+        client = OllamaClient(host=ollama_server)
+
+        assert client.generate("Hi", system_prompt="Be brief") == "Generated"
+        _, path, payload = FakeOllamaHandler.requests[-1]
+        assert path == "/api/generate"
+        assert payload["prompt"] == "Hi"
+        assert payload["system"] == "Be brief"
@@ -2,6 +2,7 @@
     Test for Os Operator module
 """
 
+import asyncio
 import pytest
 import tempfile
 import os
@@ -12,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.os_operator import OS_Operator
 from core.permission_manager import PermissionManager, PermissionLevel, ActionRequest, ActionResult
-from core.logger import AuditLogger, ActionType, ActionStatus
+from core.logger import AuditLogger, AsyncAuditLogger, ActionType, ActionStatus
 
 #CREATE FIXTURES(KINDA LIKE TEST VARIABLES OF FUNCTIONS IN THE PROGRAM)
 @pytest.fixture
@@ -25,7 +26,10 @@ def mock_permission_manager(tmp_path):
     """provides a PermissionManager that is configured to allow everything for testing"""
     config_file = tmp_path / "dummy_config.yaml"
     config_file.write_text("friday:\n  permissions:\n    auto_approve: []\n")
-    pm = PermissionManager(config_path=str(config_file))
+    pm = PermissionManager(
+        config_path=str(config_file),
+        logger=AuditLogger(log_path=str(tmp_path / "permission_log.jsonl"))
+    )
     pm.set_approval_callback(lambda desc, preview: True)
     return pm
 
@@ -56,6 +60,17 @@ class TestCreateFile:
         assert target_file.exists()
         assert target_file.read_text() == content
 
+    def test_write_file_approval_prompt(self, os_operator, mock_permission_manager, tmp_path):
+        prompts = []
+        mock_permission_manager.set_approval_callback(lambda desc, preview: prompts.append((desc, preview)) or False)
+        target_file = tmp_path / "test.txt"
+
+        result = os_operator.write_file(str(target_file), "Hello")
+
+        assert result.success is False
+        assert prompts == [("Write 5 bytes to test.txt", f"📝 This will WRITE to: {target_file}")]
+        assert not target_file.exists()
+
 class TestDeleteItem:
     """Test the OS Destroyer-Lite functionality"""
 
@@ -98,6 +113,19 @@ class TestReadFile:
         assert result.status == "success"
         assert result.data == content
 
+    def test_aread_files(self, os_operator, tmp_path):
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text(f"Content {i}")
+            paths.append(str(path))
+        paths.append(str(tmp_path / "missing.txt"))
+
+        results = asyncio.run(os_operator.aread_files(paths))
+
+        assert [r.data for r in results[:5]] == [f"Content {i}" for i in range(5)]
+        assert results[5].success is False
+
 class TestListFiles:
     """Test List Files Functionality"""
 
@@ -114,6 +142,20 @@ class TestListFiles:
         assert str(file1) in result.data
         assert str(file2) in result.data
 
+    def test_list_files_recursive_matches_rglob(self, os_operator, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "top.txt").write_text("1")
+        (tmp_path / "sub" / "mid.txt").write_text("2")
+        (tmp_path / "sub" / "deeper" / "low.txt").write_text("3")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "top.txt")
+
+        result = os_operator.list_files(str(tmp_path), recursive=True)
+        expected = [str(p) for p in tmp_path.rglob("*") if p.is_file()]
+
+        assert result.success is True
+        assert sorted(result.data) == sorted(expected)
+        assert os_operator.list_files(str(tmp_path)).data.count(str(tmp_path / "sub" / "mid.txt")) == 0
+
 class TestMoveFile:
     """Test Move File Functionality"""
 
@@ -130,6 +172,39 @@ class TestMoveFile:
         assert not source.exists()
     
 
+class TestAuditFlush:
+    """Test Flushing Queued Audit Entries"""
+
+    def test_context_manager_flushes_async_logger(self, mock_permission_manager, tmp_path):
+        log_path = tmp_path / "async_log.jsonl"
+        logger = AsyncAuditLogger(log_path=str(log_path), flush_interval=60)
+
+        with OS_Operator(permission_manager=mock_permission_manager, logger=logger) as operator:
+            operator.write_file(str(tmp_path / "a.txt"), "A")
+            operator.write_file(str(tmp_path / "b.txt"), "B")
+
+        lines = log_path.read_text().splitlines()
+        logger.close()
+        assert len(lines) == 2
+
+class TestPathResolution:
+    """Test Path Resolution"""
+
+    def test_symlink_retargeted_externally_is_followed(self, os_operator, tmp_path):
+        (tmp_path / "a.txt").write_text("A")
+        (tmp_path / "b.txt").write_text("B")
+        link = tmp_path / "link"
+        other_link = tmp_path / "other_link"
+        link.symlink_to(tmp_path / "a.txt")
+        other_link.symlink_to(tmp_path / "b.txt")
+
+        assert os_operator.read_file(str(link)).data == "A"
+        os.replace(other_link, link)
+
+        result = os_operator.read_file(str(link))
+        assert result.data == "B"
+        assert result.message == f"Successfully read {tmp_path / 'b.txt'}"
+
 class TestCopyFile:
     """Test Copy File Functionality"""
 
@@ -146,6 +221,55 @@ class TestCopyFile:
         assert destination.exists()
         assert destination.read_text() == "Copy me"
 
+    def test_copy_file_preserves_content_and_mtime(self, os_operator, tmp_path):
+        source = tmp_path / "big.bin"
+        source.write_bytes(os.urandom(3 * 1024 * 1024))
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        destination = tmp_path / "copies" / "big.bin"
+
+        result = os_operator.copy_file(str(source), str(destination))
+
+        assert result.success is True
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime == 1_000_000_000
+
+    def test_copy_file_onto_itself_keeps_source(self, os_operator, tmp_path):
+        source = tmp_path / "same.txt"
+        source.write_text("Keep me")
+
+        into_own_dir = os_operator.copy_file(str(source), str(tmp_path))
+        onto_itself = os_operator.copy_file(str(source), str(source))
+
+        assert into_own_dir.success is False
+        assert onto_itself.success is False
+        assert "are the same file" in onto_itself.message
+        assert source.read_text() == "Keep me"
+
+    def test_copy_file_falls_back_to_copy2(self, os_operator, tmp_path, monkeypatch):
+        def unsupported(*args):
+            raise OSError(18, "Invalid cross-device link")
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        source = tmp_path / "small.txt"
+        source.write_text("Copy me")
+        destination = tmp_path / "small_copy.txt"
+
+        result = os_operator.copy_file(str(source), str(destination))
+
+        assert result.success is True
+        assert destination.read_text() == "Copy me"
+
+    def test_copy_file_falls_back_when_nothing_copied(self, os_operator, tmp_path, monkeypatch):
+        # procfs, sysfs and some FUSE files report 0 bytes on the first call
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        source = tmp_path / "pseudo.txt"
+        source.write_text("Generated content")
+        destination = tmp_path / "pseudo_copy.txt"
+
+        result = os_operator.copy_file(str(source), str(destination))
+
+        assert result.success is True
+        assert destination.read_text() == "Generated content"
+
 class TestCreateDirectory:
     """Test Create Directory Functionality"""
 
@@ -188,6 +312,15 @@ class TestGetFileMetadata:
         assert "modified_at" in result.data
         assert result.data["name"] == "meta.txt"
 
+    def test_get_file_metadata_directory_and_missing(self, os_operator, tmp_path):
+        result = os_operator.get_file_metadata(str(tmp_path))
+        missing = os_operator.get_file_metadata(str(tmp_path / "missing.txt"))
+
+        assert result.data["is_dir"] is True
+        assert result.data["is_file"] is False
+        assert missing.success is False
+        assert "File not found" in missing.message
+
 class TestSearchFiles:
     """Test Search Files Functionality"""
 
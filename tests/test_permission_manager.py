@@ -2,6 +2,8 @@
 Tests for the Permission Manager module.
 """
 
+import dataclasses
+import fnmatch
 import pytest
 import tempfile
 import os
@@ -15,9 +17,13 @@ from core.permission_manager import (
     PermissionManager,
     PermissionLevel,
     ActionRequest,
-    ActionResult
+    ActionResult,
+    _compile_glob,
+    _compile_globs,
+    _bucket_globs
 )
 from core.logger import AuditLogger, ActionType, ActionStatus
+import core.permission_manager as permission_manager_module
 
 
 class TestPermissionLevel:
@@ -48,6 +54,17 @@ class TestActionRequest:
         assert action.target == "/path/to/file.txt"
         assert action.required_level == PermissionLevel.READ
     
+    def test_action_request_is_immutable(self):
+        """Test that requests can't be altered after the permission check."""
+        action = ActionRequest(
+            action_type="read_file",
+            description="Read file contents"
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            action.target = "/etc/shadow"
+        assert not hasattr(action, "__dict__")
+    
     def test_action_matches_pattern(self):
         """Test pattern matching."""
         action = ActionRequest(
@@ -58,6 +75,40 @@ class TestActionRequest:
         assert action.matches_pattern("delete_*")
         assert action.matches_pattern("delete_file")
         assert not action.matches_pattern("read_*")
+    
+    def test_action_matches_compiled_pattern(self):
+        """Test matching against a precompiled glob."""
+        action = ActionRequest(
+            action_type="delete_file",
+            description="Delete a file"
+        )
+        
+        assert action.matches_pattern(_compile_glob("delete_*"))
+        assert action.matches_pattern(_compile_glob("delete_[ef]ile"))
+        assert not action.matches_pattern(_compile_glob("delete"))
+    
+    def test_combined_globs_match_any_pattern(self):
+        """Test that a combined glob regex matches like any of its patterns."""
+        combined = _compile_globs(["delete_*", "rm -rf /*", "format_?"])
+        
+        assert combined.match("delete_file")
+        assert combined.match("rm -rf /home")
+        assert combined.match("format_c")
+        assert not combined.match("format_cd")
+        assert not combined.match("read_file")
+        assert _compile_globs([]) is None
+    
+    def test_bucketed_globs_match_like_fnmatch(self):
+        """Test that bucketed globs give the same answers as fnmatch."""
+        patterns = ["delete_*", "rm -rf /*", "format_?", "*_all", "drop*", "sys_[ab]*"]
+        buckets, rest = _bucket_globs(patterns)
+        
+        assert set(buckets) == {"delete", "format", "sys"}
+        for name in ["delete_file", "deleted_file", "format_c", "purge_all", "drop_db",
+                     "dropall", "sys_a1", "sys_c1", "rm -rf /home", "read_file"]:
+            bucket = buckets.get(name.partition("_")[0])
+            matched = bool(bucket and bucket.match(name)) or bool(rest and rest.match(name))
+            assert matched == any(fnmatch.fnmatch(name, p) for p in patterns), name
 
 
 class TestPermissionManager:
@@ -77,8 +128,11 @@ class TestPermissionManager:
       - "rm -rf /"
       - dangerous_test
 """)
+            f.flush()
             yield f.name
         os.unlink(f.name)
+        if os.path.exists(f.name + ".cache"):
+            os.unlink(f.name + ".cache")
     
     @pytest.fixture
     def temp_log(self):
@@ -134,18 +188,248 @@ class TestPermissionManager:
         
         assert result.success
     
+    def test_literal_and_glob_auto_approve(self, permission_manager):
+        """Test that literal and wildcard auto-approve patterns both match."""
+        permission_manager.auto_approve = [*permission_manager.auto_approve, "view_*"]
+        
+        assert "read_file" in permission_manager._auto_approve_literals
+        assert permission_manager._auto_approve_globs is not None
+        assert permission_manager._is_auto_approved(ActionRequest("read_file", "Read"))
+        assert permission_manager._is_auto_approved(ActionRequest("view_logs", "View"))
+        assert not permission_manager._is_auto_approved(ActionRequest("read_files", "Read"))
+    
     def test_add_to_blacklist(self, permission_manager):
         """Test adding patterns to blacklist."""
         permission_manager.add_to_blacklist("dangerous_action")
         
         assert "dangerous_action" in permission_manager.blacklist
     
+    def test_added_blacklist_pattern_enforced(self, permission_manager):
+        """Test that patterns added at runtime take effect immediately."""
+        action = ActionRequest(
+            action_type="wipe_logs",
+            description="Wipe the logs",
+            required_level=PermissionLevel.ADMIN
+        )
+        
+        permission_manager.add_to_blacklist("wipe_*")
+        assert permission_manager.check_permission(action).status == "DENIED"
+        
+        permission_manager.remove_from_blacklist("wipe_*")
+        assert permission_manager.check_permission(action).status != "DENIED"
+    
+    def test_blacklist_matches_target_and_description(self, permission_manager):
+        """Test that blacklist entries are also matched within target and description."""
+        by_target = ActionRequest(
+            action_type="execute_command",
+            description="Run a command",
+            target="sudo RM -RF / --no-preserve-root",
+            required_level=PermissionLevel.EXECUTE
+        )
+        by_description = ActionRequest(
+            action_type="execute_command",
+            description="Call format_disk on drive",
+            required_level=PermissionLevel.EXECUTE
+        )
+        
+        assert permission_manager.check_permission(by_target).status == "DENIED"
+        assert permission_manager.check_permission(by_description).status == "DENIED"
+    
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_blacklist_substring_matching(self, temp_config, temp_log, monkeypatch, use_automaton):
+        """Test substring matching with and without the optional automaton."""
+        if not use_automaton:
+            monkeypatch.setattr("core.permission_manager.ahocorasick", None)
+        elif permission_manager_module.ahocorasick is None:
+            pytest.skip("pyahocorasick is not installed")
+        permission_manager = PermissionManager(config_path=temp_config, logger=AuditLogger(log_path=temp_log))
+        
+        assert (permission_manager._blacklist_automaton is not None) == use_automaton
+        assert permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "Run", target="echo hi; rm -rf /tmp")
+        )
+        assert permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "Then FORMAT_DISK now")
+        )
+        assert not permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "List files", target="ls -la")
+        )
+    
+    def test_blacklist_gram_prefilter(self, permission_manager, monkeypatch):
+        """Test the n-gram prefilter used for large blacklists without an automaton."""
+        monkeypatch.setattr("core.permission_manager.ahocorasick", None)
+        permission_manager.blacklist = [f"threat_{i:04d}" for i in range(200)]
+        
+        assert permission_manager._blacklist_grams == {"thre"}
+        assert permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "Run", target="curl threat_0042.example")
+        )
+        assert permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "Contact THREAT_0199 now")
+        )
+        assert not permission_manager._is_blacklisted(
+            ActionRequest("execute_command", "Three threads", target="ls -la")
+        )
+    
+    def test_default_logger_is_shared(self, temp_config, monkeypatch, tmp_path):
+        """Test that managers created without a logger share one."""
+        monkeypatch.setattr(
+            permission_manager_module, "AsyncAuditLogger",
+            lambda: AuditLogger(log_path=str(tmp_path / "shared_log.jsonl"))
+        )
+        permission_manager_module._default_logger.cache_clear()
+        try:
+            first = PermissionManager(config_path=temp_config)
+            second = PermissionManager(config_path=temp_config)
+            assert first.logger is second.logger
+        finally:
+            first.logger.close()
+            permission_manager_module._default_logger.cache_clear()
+    
+    def test_pattern_lists_are_read_only(self, permission_manager):
+        """Test that pattern lists can only change through the public API."""
+        assert isinstance(permission_manager.blacklist, tuple)
+        assert isinstance(permission_manager.auto_approve, tuple)
+        
+        permission_manager.blacklist = [*permission_manager.blacklist, "wipe_*"]
+        assert permission_manager.check_action_type("wipe_all").status == "DENIED"
+        
+        permission_manager.auto_approve = ["write_file"]
+        result = permission_manager.check_action_type("write_file", PermissionLevel.SAFE_WRITE)
+        assert result.message == "Action is auto-approved."
+    
+    def test_classification_cached_until_patterns_change(self, permission_manager):
+        """Test that cached classifications are dropped when the blacklist changes."""
+        action = ActionRequest(
+            action_type="purge_cache",
+            description="Purge the cache",
+            required_level=PermissionLevel.READ
+        )
+        
+        assert permission_manager.check_permission(action).success
+        assert permission_manager.check_permission(action).success
+        assert permission_manager._classify.cache_info().hits == 1
+        
+        permission_manager.add_to_blacklist("purge_*")
+        assert not permission_manager.check_permission(action).success
+    
+    def test_one_log_entry_per_decision(self, permission_manager):
+        """Test that a decision is logged once and read approvals not at all."""
+        blocked = ActionRequest(
+            action_type="format_disk",
+            description="Format the disk",
+            target="/dev/sda",
+            required_level=PermissionLevel.ADMIN
+        )
+        read = ActionRequest(
+            action_type="peek_file",
+            description="Peek at a file",
+            required_level=PermissionLevel.READ
+        )
+        
+        permission_manager.check_permission(blocked)
+        permission_manager.check_permission(read)
+        entries = permission_manager.get_audit_log()
+        
+        assert len(entries) == 1
+        assert entries[0].status == "denied"
+        assert entries[0].metadata == {
+            "action_type": "format_disk",
+            "target": "/dev/sda",
+            "pre_state": "PENDING"
+        }
+    
+    def test_read_approval_is_shared(self, permission_manager):
+        """Test that read approvals reuse one result while blacklisting still wins."""
+        first = permission_manager.check_action_type("show_weather")
+        second = permission_manager.check_action_type("show_clock")
+        assert first is second
+        assert first.success and not first.dry_run
+        assert permission_manager.check_action_type("show_weather", dry_run=True).dry_run
+        assert permission_manager.check_action_type("format_disk").status == "DENIED"
+    
+    def test_check_action_type_fast_path(self, permission_manager):
+        """Test deciding on a bare action type without an ActionRequest."""
+        assert permission_manager.check_action_type("read_file").status == "APPROVED"
+        assert permission_manager.check_action_type("format_disk", PermissionLevel.ADMIN).status == "DENIED"
+        assert permission_manager.check_action_type("write_file", PermissionLevel.SAFE_WRITE, dry_run=True).dry_run
+        
+        # Falls through to the approval callback, which denies
+        result = permission_manager.check_action_type("write_file", PermissionLevel.SAFE_WRITE)
+        assert not result.success
+        assert result.status == "denied"
+    
     def test_add_to_whitelist(self, permission_manager):
         """Test adding patterns to whitelist."""
         permission_manager.add_to_whitelist("safe_action", PermissionLevel.SAFE_WRITE)
         
         assert "safe_action" in permission_manager.whitelist
     
+    def test_save_config_round_trip(self, permission_manager, temp_config, temp_log):
+        """Test that saved permissions are loaded back."""
+        permission_manager.add_to_blacklist("shred_*")
+        permission_manager.save_config()
+        
+        reloaded = PermissionManager(config_path=temp_config, logger=AuditLogger(log_path=temp_log))
+        
+        assert reloaded.blacklist == permission_manager.blacklist
+        assert reloaded.auto_approve == permission_manager.auto_approve
+    
+    def test_save_config_skips_unchanged_write(self, permission_manager, temp_config):
+        """Test that saving identical permissions leaves the file untouched."""
+        permission_manager.save_config()
+        first_mtime = os.stat(temp_config).st_mtime_ns
+        
+        os.utime(temp_config, ns=(first_mtime - 10**9, first_mtime - 10**9))
+        permission_manager.save_config()
+        
+        assert os.stat(temp_config).st_mtime_ns == first_mtime - 10**9
+        assert not os.path.exists(temp_config + ".tmp")
+    
+    def test_config_cache_reused_and_invalidated(self, permission_manager, temp_config, temp_log):
+        """Test that the parsed config cache is used until the YAML changes."""
+        cache_path = Path(temp_config + ".cache")
+        assert cache_path.exists()
+        
+        logger = AuditLogger(log_path=temp_log)
+        cached = PermissionManager(config_path=temp_config, logger=logger)
+        assert cached.blacklist == permission_manager.blacklist
+        
+        with open(temp_config, "a") as f:
+            f.write("      - extra_entry\n")
+        reparsed = PermissionManager(config_path=temp_config, logger=logger)
+        assert "extra_entry" in reparsed.blacklist
+    
+    def test_corrupt_config_cache_ignored(self, permission_manager, temp_config, temp_log):
+        """Test that a corrupt cache falls back to parsing the YAML."""
+        Path(temp_config + ".cache").write_bytes(b"not a pickle")
+        
+        reloaded = PermissionManager(config_path=temp_config, logger=AuditLogger(log_path=temp_log))
+        
+        assert reloaded.blacklist == permission_manager.blacklist
+    
+    def test_generate_preview(self, permission_manager):
+        """Test previews for known and unknown action types."""
+        delete = ActionRequest(
+            action_type="delete_file",
+            description="Delete a file",
+            target="/tmp/old.txt",
+            parameters={"recursive": False}
+        )
+        other = ActionRequest(
+            action_type="rename_file",
+            description="Rename a file"
+        )
+        
+        assert permission_manager._generate_preview(delete) == (
+            "⚠️  This will DELETE: /tmp/old.txt\n\nParameters:\n  - recursive: False"
+        )
+        assert permission_manager._generate_preview(other) == "🔧 This will perform: Rename a file"
+        
+        # Prefix matches without an underscore still pick the template
+        unsplit = ActionRequest(action_type="writefile", description="Write", target="a.txt")
+        assert permission_manager._generate_preview(unsplit) == "📝 This will WRITE to: a.txt"
+    
     def test_dry_run_mode(self, permission_manager):
         """Test that dry_run mode works correctly."""
         action = ActionRequest(